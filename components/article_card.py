@@ -3,6 +3,7 @@ from typing import Dict, Optional, List, Callable
 from core.i18n import i18n, _
 from datetime import datetime
 import json
+import orjson
 
 class ArticleCard:
     """Composant carte d'article réutilisable"""
@@ -78,8 +79,8 @@ class ArticleCard:
         
         try:
             if isinstance(tags_str, str):
-                return json.loads(tags_str)
-            elif isinstance(tags_str, list):
+                return orjson.loads(tags_str)
+            elif isinstance(tags_str, (list, tuple)):
                 return tags_str
             else:
                 return []
@@ -223,20 +224,20 @@ class ArticleCard:
         with ui.row().classes('gap-2'):
             ui.button(
                 _("common.read_more"),
-                on_click=lambda: self.read_article(),
+                on_click=self.read_article,
                 icon='article'
             ).classes('bg-primary text-white px-4 py-2 rounded hover:bg-secondary transition-colors')
             
             # Bouton partage
             ui.button(
                 icon='share',
-                on_click=lambda: self.share_article()
+                on_click=self.share_article
             ).classes('border border-primary text-primary px-3 py-2 rounded hover:bg-primary hover:text-white transition-colors').props('flat')
             
             # Bouton favoris
             ui.button(
                 icon='favorite_border',
-                on_click=lambda: self.toggle_favorite()
+                on_click=self.toggle_favorite
             ).classes('border border-gray-300 text-gray-600 px-3 py-2 rounded hover:bg-gray-100 transition-colors').props('flat')
     
     def read_article(self):
@@ -252,7 +253,7 @@ class ArticleCard:
         
         # Copier l'URL dans le presse-papiers
         ui.run_javascript(f"""
-            navigator.clipboard.writeText('{article_url}').then(() => {{
+            navigator.clipboard.writeText({json.dumps(article_url)}).then(() => {{
                 console.log('URL copiée dans le presse-papiers');
             }});
         """)
@@ -315,7 +316,7 @@ class ArticleCardHorizontal(ArticleCard):
                     with ui.row().classes('gap-2'):
                         ui.button(
                             _("common.read_more"),
-                            on_click=lambda: self.read_article()
+                            on_click=self.read_article
                         ).classes('bg-primary text-white px-4 py-2 rounded text-sm hover:bg-secondary transition-colors')
         
         return card
@@ -348,7 +349,7 @@ class ArticleCardCompact(ArticleCard):
                 # Action
                 ui.button(
                     _("common.read_more"),
-                    on_click=lambda: self.read_article()
+                    on_click=self.read_article
                 ).classes('bg-primary text-white px-3 py-1 rounded text-sm hover:bg-secondary transition-colors w-full')
         
         return card
\ No newline at end of file
@@ -1,6 +1,8 @@
 from nicegui import ui
 from datetime import datetime
-from core.theme import theme_manager
+from core.theme import button_classes
+
+_BUTTON_PRIMARY_SM = button_classes('primary', 'sm')
 
 class Footer:
     """Composant Footer réutilisable avec système de thème centralisé"""
@@ -117,7 +119,7 @@ class Footer:
                     ui.button(
                         icon=social.get("icon", "link"),
                         on_click=lambda url=social["url"]: self._handle_social_click(url, social["label"])
-                    ).classes(theme_manager.get_button_classes('primary', 'sm') + ' w-8 h-8 rounded-full').props('flat').tooltip(social["label"])
+                    ).classes(_BUTTON_PRIMARY_SM + ' w-8 h-8 rounded-full').props('flat').tooltip(social["label"])
     
     def _handle_social_click(self, url: str, name: str):
         """Gérer le clic sur un réseau social"""
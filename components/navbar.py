@@ -28,6 +28,9 @@ class Navbar:
             {"label": "nav.about", "url": "/about", "icon": "info"},
             {"label": "nav.contact", "url": "/contact", "icon": "contact_mail"}
         ]
+        
+        # Libellés traduits de la navigation par langue: (libellé, url, icône)
+        self._nav_labels_cache = {}
     
     def set_theme_toggle_callback(self, callback: Callable):
         """Définir le callback pour le toggle de thème"""
@@ -80,8 +83,8 @@ class Navbar:
             def _(key): return key.split('.')[-1].title()
         
         with ui.row().classes('desktop-nav gap-6 flex items-center'):
-            for item in self.nav_items:
-                ui.link(_(item["label"]), item["url"]).classes(
+            for label, url, _icon in self._get_nav_labels(_):
+                ui.link(label, url).classes(
                     'nav-link px-3 py-2 rounded-md text-muted hover:text-primary hover:bg-surface transition-all duration-200 font-medium'
                 ).style('text-decoration: none;')
     
@@ -172,11 +175,11 @@ class Navbar:
                         ui.button(icon='close', on_click=dialog.close).classes('text-muted hover:text-primary').props('flat round size=sm')
                     
                     # Navigation items
-                    for item in self.nav_items:
+                    for label, url, icon in self._get_nav_labels(_):
                         ui.button(
-                            _(item["label"]), 
-                            icon=item.get("icon"),
-                            on_click=lambda url=item["url"]: (ui.navigate.to(url), dialog.close())
+                            label, 
+                            icon=icon,
+                            on_click=lambda url=url: (ui.navigate.to(url), dialog.close())
                         ).classes('w-full justify-start text-left text-muted hover:text-primary hover:bg-surface').props('flat')
                     
                     ui.separator().classes('my-2')
@@ -210,6 +213,22 @@ class Navbar:
         
         dialog.open()
     
+    def _get_nav_labels(self, translate: Callable) -> tuple:
+        """Obtenir la navigation traduite, calculée une seule fois par langue"""
+        try:
+            from core.i18n import i18n
+            language = i18n.get_language()
+        except:
+            language = None
+        
+        labels = self._nav_labels_cache.get(language)
+        if labels is None:
+            labels = self._nav_labels_cache[language] = tuple(
+                (translate(item["label"]), item["url"], item.get("icon"))
+                for item in self.nav_items
+            )
+        return labels
+    
     def get_theme_icon(self) -> str:
         """Obtenir l'icône selon la préférence de thème"""
         if self.theme_preference == "auto":
@@ -280,16 +299,19 @@ class Navbar:
             "url": url,
             "icon": icon
         })
+        self._nav_labels_cache.clear()
         return self
     
     def remove_nav_item(self, url: str):
         """Supprimer un élément de navigation par URL"""
         self.nav_items = [item for item in self.nav_items if item["url"] != url]
+        self._nav_labels_cache.clear()
         return self
     
     def set_nav_items(self, items: list):
         """Définir tous les éléments de navigation"""
         self.nav_items = items
+        self._nav_labels_cache.clear()
         return self
     
     def _add_responsive_css(self):
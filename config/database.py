@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Float
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from datetime import datetime
 from typing import Generator
 from config.settings import settings
@@ -13,6 +13,8 @@ engine = create_engine(
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session propre à chaque thread, réutilisée par les pages au lieu d'en créer une par requête
+ScopedSession = scoped_session(SessionLocal)
 Base = declarative_base()
 
 # Modèles de base de données
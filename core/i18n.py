@@ -1,16 +1,61 @@
 import json
-from typing import Dict, Any, Optional
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 from nicegui import app
 from config.settings import settings
 
+# Langues s'écrivant de droite à gauche
+_RTL_LANGUAGES = frozenset(("ar", "he", "fa", "ur"))
+
+# Langues acceptées, pour une validation en temps constant
+_SUPPORTED_LANGUAGES = frozenset(settings.supported_languages)
+
+# Noms affichés des langues supportées
+_LANGUAGE_NAMES: Dict[str, str] = {
+    "fr": "Français",
+    "en": "English",
+    "ar": "العربية"
+}
+
+# Marqueur pour les modèles trop complexes pour le rendu précompilé
+# (spécificateurs de format, conversions, champs positionnels ou indexés)
+_FORMAT_FALLBACK = object()
+
+_FORMATTER = Formatter()
+
+_EMPTY: Dict[str, Any] = {}
+
+def _compile_template(raw: str):
+    """Précompiler un modèle de traduction en liste (littéral, champ)"""
+    if '{' not in raw and '}' not in raw:
+        return None
+    
+    parts = []
+    try:
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(raw):
+            if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+                return _FORMAT_FALLBACK
+            parts.append((literal, field_name))
+    except ValueError:
+        return _FORMAT_FALLBACK
+    
+    return tuple(parts)
+
 class I18nManager:
     """Gestionnaire d'internationalisation"""
     
     def __init__(self):
+        self.fallback_language = "en"
         self.current_language = settings.default_language
         self.translations: Dict[str, Dict[str, Any]] = {}
-        self.fallback_language = "en"
+        # Index aplati par langue: clé pointée -> (texte brut, modèle précompilé)
+        self._flat: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+        # Statistiques calculées une seule fois par chargement des traductions
+        self._stats_cache: Optional[Mapping[str, Mapping[str, Any]]] = None
         
         # Charger toutes les traductions
         self.load_translations()
@@ -28,26 +73,60 @@ class I18nManager:
             self.current_language = settings.default_language
     
     def load_translations(self):
-        """Charger toutes les traductions depuis les fichiers JSON"""
-        locales_dir = settings.locales_dir
+        """Charger toutes les traductions depuis les fichiers JSON (en parallèle)"""
+        languages = settings.supported_languages
+        if not languages:
+            return
         
-        for language in settings.supported_languages:
-            translation_file = locales_dir / f"{language}.json"
-            
-            if translation_file.exists():
-                try:
-                    with open(translation_file, 'r', encoding='utf-8') as f:
-                        self.translations[language] = json.load(f)
-                    print(f"✅ Traductions {language} chargées ({len(self.translations[language])} clés)")
-                except Exception as e:
-                    print(f"❌ Erreur lors du chargement des traductions {language}: {e}")
-                    self.translations[language] = {}
+        with ThreadPoolExecutor(max_workers=min(4, len(languages))) as executor:
+            results = list(executor.map(self._load_translation_file, languages))
+        
+        for language, translation_file, data, error in results:
+            if data is not None:
+                self.translations[language] = data
+                print(f"✅ Traductions {language} chargées ({len(data)} clés)")
+            elif error is not None:
+                print(f"❌ Erreur lors du chargement des traductions {language}: {error}")
+                self.translations[language] = {}
             else:
                 print(f"⚠️ Fichier de traduction {language} non trouvé: {translation_file}")
                 self.translations[language] = {}
                 
                 # Créer un fichier de traduction vide pour le développement
                 self._create_empty_translation_file(language, translation_file)
+            
+            self._build_flat_index(language)
+        
+        # Les traductions ont changé: les statistiques seront recalculées
+        self._stats_cache = None
+    
+    def _build_flat_index(self, language: str):
+        """Aplatir les traductions d'une langue et précompiler leurs modèles"""
+        flat = {}
+        
+        def walk(obj: Dict[str, Any], prefix: str):
+            for key, value in obj.items():
+                current_key = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, str):
+                    flat[current_key] = (value, _compile_template(value))
+                elif isinstance(value, dict):
+                    walk(value, current_key)
+        
+        walk(self.translations.get(language, {}), "")
+        self._flat[language] = flat
+    
+    @staticmethod
+    def _load_translation_file(language: str):
+        """Lire et parser un fichier de traduction (exécuté dans un thread)"""
+        translation_file = settings.locales_dir / f"{language}.json"
+        
+        if not translation_file.exists():
+            return language, translation_file, None, None
+        
+        try:
+            return language, translation_file, orjson.loads(translation_file.read_bytes()), None
+        except Exception as e:
+            return language, translation_file, None, e
     
     def _create_empty_translation_file(self, language: str, file_path: Path):
         """Créer un fichier de traduction vide pour le développement"""
@@ -78,11 +157,25 @@ class I18nManager:
         except Exception as e:
             print(f"❌ Impossible de créer le fichier {language}: {e}")
     
+    @property
+    def current_language(self) -> str:
+        """Langue actuelle"""
+        return self._current_language
+    
+    @current_language.setter
+    def current_language(self, language: str):
+        """Définir la langue actuelle et précalculer sa direction et ses fallbacks"""
+        self._current_language = language
+        self._is_rtl = language in _RTL_LANGUAGES
+        self._direction = "rtl" if self._is_rtl else "ltr"
+        # Ordre de recherche: langue actuelle, langue de fallback, puis français
+        self._fallbacks = tuple(dict.fromkeys((language, self.fallback_language, "fr")))
+    
     def load_language(self):
         """Charger la langue depuis le storage du navigateur"""
         try:
             stored_language = app.storage.user.get('language', settings.default_language)
-            if stored_language in settings.supported_languages:
+            if stored_language in _SUPPORTED_LANGUAGES:
                 self.current_language = stored_language
                 print(f"🌐 Langue chargée depuis le storage: {stored_language}")
             else:
@@ -102,7 +195,7 @@ class I18nManager:
     
     def set_language(self, language: str) -> bool:
         """Définir la langue actuelle"""
-        if language in settings.supported_languages:
+        if isinstance(language, str) and language in _SUPPORTED_LANGUAGES:
             old_language = self.current_language
             self.current_language = language
             self.save_language()
@@ -118,68 +211,49 @@ class I18nManager:
     
     def get_supported_languages(self) -> Dict[str, str]:
         """Obtenir les langues supportées avec leurs noms"""
-        return {
-            "fr": "Français",
-            "en": "English", 
-            "ar": "العربية"
-        }
+        return dict(_LANGUAGE_NAMES)
     
     def get_language_name(self, language_code: str) -> str:
         """Obtenir le nom d'une langue"""
-        return self.get_supported_languages().get(language_code, language_code)
+        return _LANGUAGE_NAMES.get(language_code, language_code)
     
     def translate(self, key: str, **kwargs) -> str:
         """Traduire une clé dans la langue actuelle"""
-        # Récupérer la traduction dans la langue actuelle
-        translation = self._get_nested_translation(
-            self.translations.get(self.current_language, {}), key
-        )
-        
-        # Si pas de traduction, essayer la langue de fallback
-        if translation is None and self.current_language != self.fallback_language:
-            translation = self._get_nested_translation(
-                self.translations.get(self.fallback_language, {}), key
-            )
-        
-        # Si toujours pas de traduction, essayer le français
-        if translation is None and self.current_language != "fr":
-            translation = self._get_nested_translation(
-                self.translations.get("fr", {}), key
-            )
+        # Chercher dans la langue actuelle puis dans les langues de fallback
+        entry = None
+        for language in self._fallbacks:
+            entry = self._flat.get(language, _EMPTY).get(key)
+            if entry is not None:
+                break
         
         # Si toujours pas de traduction, retourner la clé avec un indicateur
-        if translation is None:
+        if entry is None:
             print(f"⚠️ Traduction manquante: {key} (langue: {self.current_language})")
             return f"[{key}]"  # Indicateur visuel pour les traductions manquantes
         
         # Formater avec les arguments
+        translation, parts = entry
+        if parts is None:
+            return translation
+        
         try:
-            return translation.format(**kwargs)
+            if parts is _FORMAT_FALLBACK:
+                return translation.format(**kwargs)
+            return "".join(
+                literal if field_name is None else literal + str(kwargs[field_name])
+                for literal, field_name in parts
+            )
         except (KeyError, ValueError) as e:
             print(f"⚠️ Erreur de formatage pour {key}: {e}")
             return translation
     
-    def _get_nested_translation(self, translations: Dict[str, Any], key: str) -> Optional[str]:
-        """Récupérer une traduction imbriquée avec notation pointée"""
-        keys = key.split('.')
-        current = translations
-        
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return None
-        
-        return current if isinstance(current, str) else None
-    
     def get_language_direction(self) -> str:
         """Obtenir la direction du texte pour la langue actuelle"""
-        rtl_languages = ["ar", "he", "fa", "ur"]
-        return "rtl" if self.current_language in rtl_languages else "ltr"
+        return self._direction
     
     def is_rtl(self) -> bool:
         """Vérifier si la langue actuelle est RTL"""
-        return self.get_language_direction() == "rtl"
+        return self._is_rtl
     
     def get_locale_info(self) -> Dict[str, Any]:
         """Obtenir les informations de localisation"""
@@ -191,17 +265,22 @@ class I18nManager:
             "supported_languages": self.get_supported_languages()
         }
     
-    def get_translation_stats(self) -> Dict[str, Any]:
-        """Obtenir les statistiques des traductions"""
+    def get_translation_stats(self) -> Mapping[str, Mapping[str, Any]]:
+        """Obtenir les statistiques des traductions (mises en cache jusqu'au prochain chargement,
+        vue en lecture seule: utiliser dict() pour une copie)"""
+        if self._stats_cache is not None:
+            return self._stats_cache
+        
         stats = {}
         
         for lang, translations in self.translations.items():
-            stats[lang] = {
+            stats[lang] = MappingProxyType({
                 "total_keys": self._count_keys(translations),
                 "language_name": self.get_language_name(lang)
-            }
+            })
         
-        return stats
+        self._stats_cache = MappingProxyType(stats)
+        return self._stats_cache
     
     def _count_keys(self, obj: Any) -> int:
         """Compter récursivement le nombre de clés de traduction"""
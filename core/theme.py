@@ -1,8 +1,17 @@
+import asyncio
+import hashlib
+import logging
+import re
 from enum import Enum
-from typing import Dict, Any, Optional
-from nicegui import ui, app
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+from fastapi.responses import Response
+from nicegui import ui, app, context
 from config.settings import settings
 
+logger = logging.getLogger("mindcare.theme")
+
 class Theme(Enum):
     """Énumération des thèmes disponibles"""
     LIGHT = "light"
@@ -14,710 +23,1083 @@ class ThemePreference(Enum):
     LIGHT = "light"  # Forcé en clair
     DARK = "dark"   # Forcé en sombre
 
-class ThemeManager:
-    def __init__(self):
-        # État du thème
-        self.current_theme = Theme.LIGHT
-        self.theme_preference = ThemePreference.AUTO  # Par défaut, suit le système
-        self.system_theme = Theme.LIGHT  # Thème détecté du système
-        
-        # Palette de couleurs centralisée (votre code existant)
-        self.theme_colors = {
-            Theme.LIGHT: {
-                # Couleurs principales
-                'primary': '#10b981',        # Vert principal
-                'primary_dark': '#059669',   # Vert foncé pour hover
-                'primary_light': '#34d399',  # Vert clair
-                'secondary': '#6366f1',      # Indigo
-                'secondary_dark': '#4f46e5', # Indigo foncé
-                'accent': '#f59e0b',         # Amber
-                
-                # Couleurs de fond et surface
-                'background': '#ffffff',
-                'surface': '#f8fafc',        # Gris très clair
-                'surface_elevated': '#ffffff',
-                'card_background': '#ffffff',
-                
-                # Texte
-                'text': '#1f2937',           # Gris très foncé
-                'text_secondary': '#6b7280', # Gris moyen
-                'text_muted': '#9ca3af',     # Gris clair
-                'text_inverse': '#ffffff',   # Blanc pour contraste
-                
-                # Bordures
-                'border': '#e5e7eb',         # Gris clair pour bordures
-                'border_focus': '#10b981',   # Vert pour focus
-                'divider': '#f3f4f6',        # Gris très clair pour dividers
-                
-                # États
-                'success': '#10b981',        # Vert
-                'warning': '#f59e0b',        # Amber
-                'error': '#ef4444',          # Rouge
-                'info': '#3b82f6',           # Bleu
-                
-                # États de couleur de fond
-                'success_bg': '#f0fdf4',     # Vert très clair
-                'warning_bg': '#fffbeb',     # Amber très clair
-                'error_bg': '#fef2f2',       # Rouge très clair
-                'info_bg': '#eff6ff',        # Bleu très clair
-                
-                # Hover states
-                'hover': '#f9fafb',          # Gris très léger
-                'hover_primary': '#059669',  # Vert foncé
-                'hover_secondary': '#4f46e5', # Indigo foncé
-                
-                # Gradients
-                'gradient_primary': 'linear-gradient(135deg, #10b981, #34d399)',
-                'gradient_secondary': 'linear-gradient(135deg, #6366f1, #8b5cf6)',
-                'gradient_hero': 'linear-gradient(135deg, #10b981, #34d399)',
-            },
-            
-            Theme.DARK: {
-                # Couleurs principales (adaptées pour le dark mode)
-                'primary': '#34d399',        # Vert plus clair pour le dark
-                'primary_dark': '#10b981',   # Vert standard pour hover
-                'primary_light': '#6ee7b7',  # Vert très clair
-                'secondary': '#818cf8',      # Indigo plus clair
-                'secondary_dark': '#6366f1', # Indigo standard
-                'accent': '#fbbf24',         # Amber plus clair
-                
-                # Couleurs de fond et surface
-                'background': '#111827',     # Gris très foncé
-                'surface': '#1f2937',        # Gris foncé
-                'surface_elevated': '#374151', # Gris moyen foncé
-                'card_background': '#1f2937',
-                
-                # Texte
-                'text': '#f9fafb',           # Blanc cassé
-                'text_secondary': '#d1d5db', # Gris clair
-                'text_muted': '#9ca3af',     # Gris moyen
-                'text_inverse': '#111827',   # Noir pour contraste
-                
-                # Bordures
-                'border': '#374151',         # Gris moyen pour bordures
-                'border_focus': '#34d399',   # Vert pour focus
-                'divider': '#374151',        # Gris moyen pour dividers
-                
-                # États
-                'success': '#34d399',        # Vert clair
-                'warning': '#fbbf24',        # Amber clair
-                'error': '#f87171',          # Rouge clair
-                'info': '#60a5fa',           # Bleu clair
-                
-                # États de couleur de fond
-                'success_bg': '#064e3b',     # Vert très foncé
-                'warning_bg': '#78350f',     # Amber très foncé
-                'error_bg': '#7f1d1d',       # Rouge très foncé
-                'info_bg': '#1e3a8a',        # Bleu très foncé
-                
-                # Hover states
-                'hover': '#374151',          # Gris moyen
-                'hover_primary': '#10b981',  # Vert standard
-                'hover_secondary': '#6366f1', # Indigo standard
-                
-                # Gradients
-                'gradient_primary': 'linear-gradient(135deg, #34d399, #6ee7b7)',
-                'gradient_secondary': 'linear-gradient(135deg, #818cf8, #a78bfa)',
-                'gradient_hero': 'linear-gradient(135deg, #34d399, #6ee7b7)',
-            }
-        }
-        
-        # Tailles et espacements centralisés (votre code existant)
-        self.spacing = {
-            'xs': '0.25rem',    # 4px
-            'sm': '0.5rem',     # 8px
-            'md': '1rem',       # 16px
-            'lg': '1.5rem',     # 24px
-            'xl': '2rem',       # 32px
-            '2xl': '2.5rem',    # 40px
-            '3xl': '3rem',      # 48px
-            '4xl': '4rem',      # 64px
-        }
-        
-        # Rayons de bordure
-        self.border_radius = {
-            'none': '0',
-            'sm': '0.25rem',    # 4px
-            'md': '0.375rem',   # 6px
-            'lg': '0.5rem',     # 8px
-            'xl': '0.75rem',    # 12px
-            '2xl': '1rem',      # 16px
-            'full': '9999px',   # Cercle parfait
-        }
-        
-        # Ombres
-        self.shadows = {
-            'none': 'none',
-            'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
-            'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
-            'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
-            'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
-        }
-
-    def delayed_system_detection(self):
-        """Détecter le thème système après l'initialisation"""
-        try:
-            # Maintenant on peut utiliser JavaScript
-            self.detect_system_theme()
-            
-            # Ajouter la classe de thème
-            ui.run_javascript(f"""
-                document.documentElement.className = 'theme-{self.theme_preference.value}';
-                console.log('🎨 Thème initialisé:', '{self.current_theme.value}', 'Préférence:', '{self.theme_preference.value}');
-            """)
-        except Exception as e:
-            print(f"⚠️ Détection système échouée: {e}")
-
-    def detect_system_theme(self):
-        """Détecter le thème système via JavaScript (de manière sécurisée)"""
-        try:
-            ui.run_javascript("""
-                // Détecter le thème système
-                const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
-                const systemTheme = prefersDark ? 'dark' : 'light';
-                
-                // Envoyer le résultat au serveur via un événement personnalisé
-                fetch('/api/theme/system-detected', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({theme: systemTheme})
-                }).catch(() => {
-                    // Fallback: utiliser le localStorage temporaire
-                    localStorage.setItem('detected_system_theme', systemTheme);
-                    console.log('🎨 Thème système détecté (fallback):', systemTheme);
-                });
-                
-                // Écouter les changements de thème système
-                window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', (e) => {
-                    const newSystemTheme = e.matches ? 'dark' : 'light';
-                    fetch('/api/theme/system-changed', {
-                        method: 'POST',
-                        headers: {'Content-Type': 'application/json'},
-                        body: JSON.stringify({theme: newSystemTheme})
-                    }).catch(() => {
-                        localStorage.setItem('detected_system_theme', newSystemTheme);
-                        console.log('🔄 Changement thème système (fallback):', newSystemTheme);
-                    });
-                });
-                
-                console.log('🎨 Détection thème système initialisée');
-            """)
-        except Exception as e:
-            # Fallback si JavaScript échoue
-            print(f"⚠️ Impossible de détecter le thème système: {e}")
-            self.system_theme = Theme.LIGHT
+# Résolution des valeurs stockées sans passer par le constructeur des enums (pas d'exception)
+_THEME_BY_VALUE: Dict[str, Theme] = {theme.value: theme for theme in Theme}
+_PREF_BY_VALUE: Dict[str, ThemePreference] = {preference.value: preference for preference in ThemePreference}
 
-    def load_theme_preferences(self):
-        """Charger les préférences de thème depuis le storage"""
-        try:
-            # Charger la préférence utilisateur
-            stored_preference = app.storage.user.get('theme_preference', 'auto')
-            self.theme_preference = ThemePreference(stored_preference)
-            
-            # Charger le thème système détecté (si disponible)
-            stored_system_theme = app.storage.user.get('system_theme', 'light')
-            self.system_theme = Theme(stored_system_theme)
-            
-            # Appliquer le thème approprié
-            self.apply_theme_preference()
-            
-        except (RuntimeError, ValueError, KeyError):
-            # Fallback en cas d'erreur
-            self.theme_preference = ThemePreference.AUTO
-            self.system_theme = Theme.LIGHT
-            self.current_theme = Theme.LIGHT
+# Cycle du toggle (auto → light → dark → auto): préférence suivante, thème forcé, message.
+# Le passage en automatique dépend du thème système, résolu au moment du toggle.
+_TOGGLE_NEXT: Dict[ThemePreference, Tuple[ThemePreference, Optional[Theme], Optional[str]]] = {
+    ThemePreference.AUTO: (ThemePreference.LIGHT, Theme.LIGHT, "Thème clair forcé"),
+    ThemePreference.LIGHT: (ThemePreference.DARK, Theme.DARK, "Thème sombre forcé"),
+    ThemePreference.DARK: (ThemePreference.AUTO, None, None),
+}
 
-    def load_theme(self):
-        """Méthode de compatibilité - redirige vers load_theme_preferences"""
-        return self.load_theme_preferences()
+# URL du CSS non critique servi comme feuille de style externe
+DEFERRED_CSS_PATH = '/theme/deferred.css'
 
-    def save_theme_preferences(self):
-        """Sauvegarder les préférences de thème"""
-        try:
-            app.storage.user['theme_preference'] = self.theme_preference.value
-            app.storage.user['system_theme'] = self.system_theme.value
-            app.storage.user['current_theme'] = self.current_theme.value
-        except (RuntimeError, ValueError):
-            print("⚠️ Impossible de sauvegarder les préférences de thème")
+# Minification du CSS: commentaires supprimés, espaces réduits autour des délimiteurs.
+# Les espaces devant ':' sont conservés (combinateur descendant dans les sélecteurs).
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE_RE = re.compile(r"\s*([{};,])\s*|(:)\s+|\s+")
 
-    def apply_theme_preference(self):
-        """Appliquer le thème selon la préférence utilisateur"""
-        if self.theme_preference == ThemePreference.AUTO:
-            # Suivre le thème système
-            self.current_theme = self.system_theme
-        elif self.theme_preference == ThemePreference.LIGHT:
-            # Forcer le thème clair
-            self.current_theme = Theme.LIGHT
-        elif self.theme_preference == ThemePreference.DARK:
-            # Forcer le thème sombre
-            self.current_theme = Theme.DARK
+def minify_css(css: str) -> str:
+    """Minifier un bloc CSS (appliqué une seule fois, à la construction des feuilles)"""
+    minified = _CSS_WHITESPACE_RE.sub(
+        lambda m: m.group(1) or m.group(2) or ' ',
+        _CSS_COMMENT_RE.sub('', css),
+    )
+    return minified.replace(';}', '}').strip()
 
-    def set_system_theme(self, system_theme: Theme):
-        """Mettre à jour le thème système détecté"""
-        self.system_theme = system_theme
+# Détection du thème système et écoute de ses changements. Le thème détecté est
+# mémorisé côté client et transmis au serveur seulement quand il change (premier
+# chargement avec une valeur différente, puis changements du système), pour que
+# theme_manager.system_theme (libellés et infobulles du mode auto) reste à jour.
+_SYSTEM_THEME_DETECTION_JS = """
+        const postSystemTheme = (url, theme) => fetch(url, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({theme: theme}),
+            keepalive: true
+        }).catch(() => {});
+        
+        // Détecter le thème système
+        const systemQuery = window.matchMedia('(prefers-color-scheme: dark)');
+        const detectedTheme = systemQuery.matches ? 'dark' : 'light';
+        if (localStorage.getItem('detected_system_theme') !== detectedTheme) {
+            localStorage.setItem('detected_system_theme', detectedTheme);
+            postSystemTheme('/api/theme/system-detected', detectedTheme);
+        }
         
-        # Si l'utilisateur suit le système, appliquer le changement
-        if self.theme_preference == ThemePreference.AUTO:
-            old_theme = self.current_theme
-            self.current_theme = system_theme
+        // Écouter les changements de thème système
+        systemQuery.addEventListener('change', (e) => {
+            const newSystemTheme = e.matches ? 'dark' : 'light';
+            localStorage.setItem('detected_system_theme', newSystemTheme);
             
-            # Sauvegarder et appliquer seulement si le thème a changé
-            if old_theme != self.current_theme:
-                self.save_theme_preferences()
-                self.update_theme_dynamically()
-                
-                theme_name = 'sombre' if self.current_theme == Theme.DARK else 'clair'
-                ui.notify(f'Thème système changé vers {theme_name}', type='info')
-
-    def toggle_theme(self):
-        """Basculer entre les thèmes (cycle: auto → light → dark → auto)"""
-        if self.theme_preference == ThemePreference.AUTO:
-            # Auto → Light
-            self.theme_preference = ThemePreference.LIGHT
-            self.current_theme = Theme.LIGHT
-            message = "Thème clair forcé"
-        elif self.theme_preference == ThemePreference.LIGHT:
-            # Light → Dark
-            self.theme_preference = ThemePreference.DARK
-            self.current_theme = Theme.DARK
-            message = "Thème sombre forcé"
-        else:
-            # Dark → Auto
-            self.theme_preference = ThemePreference.AUTO
-            self.current_theme = self.system_theme
-            theme_name = 'sombre' if self.current_theme == Theme.DARK else 'clair'
-            message = f"Thème automatique ({theme_name})"
-        
-        self.save_theme_preferences()
-        self.update_theme_dynamically()
-        self.force_refresh_form_fields()
-        self.ensure_high_css_specificity()
+            // En mode automatique, suivre le système directement dans le navigateur
+            if ((localStorage.getItem('theme_preference') || 'auto') === 'auto') {
+                window.__setTheme('auto');
+            }
+            postSystemTheme('/api/theme/system-changed', newSystemTheme);
+            console.log('🔄 Changement thème système:', newSystemTheme);
+        });
         
-        ui.notify(message, type='info')
+        console.log('🎨 Détection thème système initialisée');
+"""
 
-    def set_theme_preference(self, preference: ThemePreference):
-        """Définir une préférence de thème spécifique"""
-        self.theme_preference = preference
-        self.apply_theme_preference()
-        self.save_theme_preferences()
-        self.update_theme_dynamically()
+# Script en ligne dans le <head> partagé par toutes les pages: définit l'assistant
+# window.__setTheme puis lance la détection du thème système (sans état du serveur)
+_THEME_SHARED_JS = """
+    window.__setTheme = function(preference) {
+        const theme = preference === 'auto'
+            ? (window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light')
+            : preference;
+        localStorage.setItem('theme_preference', preference);
+        
+        // Écritures DOM regroupées dans un seul frame: un seul recalcul de style
+        requestAnimationFrame(() => {
+            const root = document.documentElement;
+            root.setAttribute('data-theme', theme);
+            root.classList.remove('theme-auto', 'theme-light', 'theme-dark');
+            root.classList.add('theme-' + preference);
+        });
+    };
+    (function() {""" + _SYSTEM_THEME_DETECTION_JS + """})();
+"""
 
-    def get_theme_status(self) -> Dict[str, str]:
-        """Obtenir le statut complet du thème"""
-        return {
-            'current_theme': self.current_theme.value,
-            'theme_preference': self.theme_preference.value,
-            'system_theme': self.system_theme.value,
-            'is_following_system': self.theme_preference == ThemePreference.AUTO
+# Script d'amorçage propre à chaque page: applique la préférence mémorisée (ou, à la
+# première visite, celle lue dans le storage de l'utilisateur au rendu) avant le premier rendu
+_THEME_SEED_JS = Template("""
+    (function() {
+        // Première visite ou nouvel appareil: préférence du serveur (storage utilisateur)
+        let preference = localStorage.getItem('theme_preference');
+        if (preference === null) {
+            preference = '$server_preference';
+            localStorage.setItem('theme_preference', preference);
         }
+        // En automatique, le thème résolu par le serveur sert de repli sans matchMedia
+        const theme = preference !== 'auto' ? preference
+            : window.matchMedia
+                ? (window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light')
+                : '$server_theme';
+        document.documentElement.setAttribute('data-theme', theme);
+        document.documentElement.classList.add('theme-' + preference);
+    })();
+""")
 
-    def get_color(self, color_name: str) -> str:
-        """Obtenir une couleur du thème actuel"""
-        return self.theme_colors[self.current_theme].get(color_name, '#000000')
-    
-    def get_colors(self) -> Dict[str, str]:
-        """Obtenir toutes les couleurs du thème actuel"""
-        return self.theme_colors[self.current_theme].copy()
-    
-    def get_spacing(self, size: str) -> str:
-        """Obtenir une valeur d'espacement"""
-        return self.spacing.get(size, '1rem')
-    
-    def get_border_radius(self, size: str) -> str:
-        """Obtenir un rayon de bordure"""
-        return self.border_radius.get(size, '0.375rem')
-    
-    def get_shadow(self, size: str) -> str:
-        """Obtenir une ombre"""
-        return self.shadows.get(size, 'none')
-    
-    def generate_css(self) -> str:
-        """Générer le CSS du thème avec détection système"""
-        colors = self.get_colors()
-        
-        # Générer les variables CSS
-        css_vars = []
-        for name, color in colors.items():
-            css_vars.append(f"--theme-{name.replace('_', '-')}: {color}")
-        
-        # Ajouter les variables d'espacement
-        for name, value in self.spacing.items():
-            css_vars.append(f"--spacing-{name}: {value}")
-        
-        # Ajouter les variables de border-radius
-        for name, value in self.border_radius.items():
-            css_vars.append(f"--radius-{name}: {value}")
-        
-        # Ajouter les variables d'ombre
-        for name, value in self.shadows.items():
-            css_vars.append(f"--shadow-{name}: {value}")
-        
-        return f"""
-        :root {{
-            {'; '.join(css_vars)};
-        }}
-        
-        /* Détection automatique du thème système (fallback) */
-        @media (prefers-color-scheme: dark) {{
-            :root.theme-auto {{
-                --theme-primary: #34d399;
-                --theme-primary-dark: #10b981;
-                --theme-background: #111827;
-                --theme-surface: #1f2937;
-                --theme-card-background: #1f2937;
-                --theme-text: #f9fafb;
-                --theme-text-secondary: #d1d5db;
-                --theme-text-muted: #9ca3af;
-                --theme-border: #374151;
-                /* Autres variables dark... */
-            }}
-        }}
+# Squelette des variables CSS des deux thèmes (substitution unique, sans échappement d'accolades)
+_VARS_CSS_TEMPLATE = Template("""
+        :root {
+            $shared_vars;
+        }
+        
+        :root, :root[data-theme="light"] {
+            $light_vars;
+        }
+        
+        :root[data-theme="dark"] {
+            $dark_vars;
+        }
         
+        /* Détection automatique du thème système (fallback), même palette que le thème sombre */
+        @media (prefers-color-scheme: dark) {
+            :root.theme-auto {
+                $dark_vars;
+            }
+        }
+        """)
+
+# Styles de base critiques, identiques pour les deux thèmes
+_BASE_CSS = minify_css("""
         /* === STYLES DE BASE === */
-        body {{
+        body {
             background-color: var(--theme-background);
             color: var(--theme-text);
             transition: background-color 0.3s ease, color 0.3s ease;
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }}
+        }
+        """)
+
+# Styles à haute spécificité pour les champs de formulaire NiceGUI/Quasar
+_HIGH_SPECIFICITY_RULES = minify_css("""
+        /* Spécificité renforcée par classe doublée (sélecteurs composés, sans chaîne de descendants) */
+        .q-field__native.q-field__native,
+        .q-field__input.q-field__input {
+            color: var(--theme-text) !important;
+        }
+        
+        .q-field__label.q-field__label {
+            color: var(--theme-text-secondary) !important;
+        }
         
+        .q-field--focused .q-field__label.q-field__label {
+            color: var(--theme-primary) !important;
+        }
+        
+        /* Placeholder avec spécificité élevée */
+        .q-field__native.q-field__native::placeholder,
+        .q-field__input.q-field__input::placeholder {
+            color: var(--theme-text-muted) !important;
+            opacity: 0.7 !important;
+        }
+        
+        /* Classe helper pour forcer la mise à jour */
+        .theme-refresh {
+            transition: color 0.1s ease !important;
+        }
+        """)
+
+_HIGH_SPECIFICITY_CSS = f"<style>{_HIGH_SPECIFICITY_RULES}</style>"
+
+# CSS non critique, identique pour les deux thèmes
+_DEFERRED_CSS = minify_css("""
         /* === CLASSES UTILITAIRES POUR LES COULEURS === */
         
         /* Backgrounds */
-        .bg-primary {{ background-color: var(--theme-primary) !important; }}
-        .bg-primary-dark {{ background-color: var(--theme-primary-dark) !important; }}
-        .bg-primary-light {{ background-color: var(--theme-primary-light) !important; }}
-        .bg-secondary {{ background-color: var(--theme-secondary) !important; }}
-        .bg-surface {{ background-color: var(--theme-surface) !important; }}
-        .bg-card {{ background-color: var(--theme-card-background) !important; }}
-        .bg-success {{ background-color: var(--theme-success) !important; }}
-        .bg-warning {{ background-color: var(--theme-warning) !important; }}
-        .bg-error {{ background-color: var(--theme-error) !important; }}
-        .bg-info {{ background-color: var(--theme-info) !important; }}
+        .bg-primary { background-color: var(--theme-primary) !important; }
+        .bg-primary-dark { background-color: var(--theme-primary-dark) !important; }
+        .bg-primary-light { background-color: var(--theme-primary-light) !important; }
+        .bg-secondary { background-color: var(--theme-secondary) !important; }
+        .bg-surface { background-color: var(--theme-surface) !important; }
+        .bg-card { background-color: var(--theme-card-background) !important; }
+        .bg-success { background-color: var(--theme-success) !important; }
+        .bg-warning { background-color: var(--theme-warning) !important; }
+        .bg-error { background-color: var(--theme-error) !important; }
+        .bg-info { background-color: var(--theme-info) !important; }
         
         /* Background states */
-        .bg-success-light {{ background-color: var(--theme-success-bg) !important; }}
-        .bg-warning-light {{ background-color: var(--theme-warning-bg) !important; }}
-        .bg-error-light {{ background-color: var(--theme-error-bg) !important; }}
-        .bg-info-light {{ background-color: var(--theme-info-bg) !important; }}
+        .bg-success-light { background-color: var(--theme-success-bg) !important; }
+        .bg-warning-light { background-color: var(--theme-warning-bg) !important; }
+        .bg-error-light { background-color: var(--theme-error-bg) !important; }
+        .bg-info-light { background-color: var(--theme-info-bg) !important; }
         
         /* Text colors */
-        .text-primary {{ color: var(--theme-primary) !important; }}
-        .text-primary-dark {{ color: var(--theme-primary-dark) !important; }}
-        .text-secondary {{ color: var(--theme-secondary) !important; }}
-        .text-main {{ color: var(--theme-text) !important; }}
-        .text-muted {{ color: var(--theme-text-secondary) !important; }}
-        .text-light {{ color: var(--theme-text-muted) !important; }}
-        .text-inverse {{ color: var(--theme-text-inverse) !important; }}
-        .text-success {{ color: var(--theme-success) !important; }}
-        .text-warning {{ color: var(--theme-warning) !important; }}
-        .text-error {{ color: var(--theme-error) !important; }}
-        .text-info {{ color: var(--theme-info) !important; }}
+        .text-primary { color: var(--theme-primary) !important; }
+        .text-primary-dark { color: var(--theme-primary-dark) !important; }
+        .text-secondary { color: var(--theme-secondary) !important; }
+        .text-main { color: var(--theme-text) !important; }
+        .text-muted { color: var(--theme-text-secondary) !important; }
+        .text-light { color: var(--theme-text-muted) !important; }
+        .text-inverse { color: var(--theme-text-inverse) !important; }
+        .text-success { color: var(--theme-success) !important; }
+        .text-warning { color: var(--theme-warning) !important; }
+        .text-error { color: var(--theme-error) !important; }
+        .text-info { color: var(--theme-info) !important; }
         
         /* Borders */
-        .border-primary {{ border-color: var(--theme-primary) !important; }}
-        .border-default {{ border-color: var(--theme-border) !important; }}
-        .border-focus {{ border-color: var(--theme-border-focus) !important; }}
+        .border-primary { border-color: var(--theme-primary) !important; }
+        .border-default { border-color: var(--theme-border) !important; }
+        .border-focus { border-color: var(--theme-border-focus) !important; }
         
         /* === CLASSES UTILITAIRES POUR LES BOUTONS === */
-        .btn-primary {{
+        .btn-primary {
             background-color: var(--theme-primary) !important;
             color: var(--theme-text-inverse) !important;
             border: none !important;
             transition: all 0.2s ease !important;
-        }}
+        }
         
-        .btn-primary:hover {{
+        .btn-primary:hover {
             background-color: var(--theme-primary-dark) !important;
             transform: translateY(-1px);
             box-shadow: var(--shadow-md);
-        }}
+        }
         
-        .btn-secondary {{
+        .btn-secondary {
             background-color: var(--theme-secondary) !important;
             color: var(--theme-text-inverse) !important;
             border: none !important;
             transition: all 0.2s ease !important;
-        }}
+        }
         
-        .btn-secondary:hover {{
+        .btn-secondary:hover {
             background-color: var(--theme-secondary-dark) !important;
             transform: translateY(-1px);
             box-shadow: var(--shadow-md);
-        }}
+        }
         
-        .btn-outline {{
+        .btn-outline {
             background-color: transparent !important;
             color: var(--theme-primary) !important;
             border: 2px solid var(--theme-primary) !important;
             transition: all 0.2s ease !important;
-        }}
+        }
         
-        .btn-outline:hover {{
+        .btn-outline:hover {
             background-color: var(--theme-primary) !important;
             color: var(--theme-text-inverse) !important;
-        }}
+        }
         
-        .btn-ghost {{
+        .btn-ghost {
             background-color: transparent !important;
             color: var(--theme-primary) !important;
             border: none !important;
-        }}
+        }
         
-        .btn-ghost:hover {{
+        .btn-ghost:hover {
             background-color: var(--theme-hover) !important;
-        }}
+        }
         
         /* === CLASSES UTILITAIRES POUR LES CARTES === */
-        .card {{
+        .card {
             background-color: var(--theme-card-background) !important;
             border: 1px solid var(--theme-border) !important;
             border-radius: var(--radius-lg) !important;
             box-shadow: var(--shadow-sm) !important;
             transition: all 0.3s ease !important;
-        }}
+        }
         
-        .card:hover {{
+        .card:hover {
             box-shadow: var(--shadow-lg) !important;
             transform: translateY(-2px);
-        }}
+        }
         
-        .card-elevated {{
+        .card-elevated {
             background-color: var(--theme-surface-elevated) !important;
             box-shadow: var(--shadow-md) !important;
-        }}
+        }
         
         /* === GRADIENTS === */
-        .gradient-primary {{
+        .gradient-primary {
             background: var(--theme-gradient-primary) !important;
-        }}
+        }
         
-        .gradient-secondary {{
+        .gradient-secondary {
             background: var(--theme-gradient-secondary) !important;
-        }}
+        }
         
-        .gradient-hero {{
+        .gradient-hero {
             background: var(--theme-gradient-hero) !important;
-        }}
+        }
         
         /* === CLASSES UTILITAIRES POUR LA MISE EN PAGE === */
-        .page-container {{
+        .page-container {
             max-width: 1200px;
             margin: 0 auto;
             padding-left: var(--spacing-lg);
             padding-right: var(--spacing-lg);
-        }}
+        }
         
-        @media (min-width: 1201px) {{
-            .page-container {{
+        @media (min-width: 1201px) {
+            .page-container {
                 max-width: 1400px;
                 padding-left: var(--spacing-xl);
                 padding-right: var(--spacing-xl);
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 768px) {{
-            .page-container {{
+        @media (max-width: 768px) {
+            .page-container {
                 padding-left: var(--spacing-md);
                 padding-right: var(--spacing-md);
-            }}
-        }}
+            }
+        }
         
         /* === ANIMATIONS ET TRANSITIONS === */
-        .theme-transition {{
+        .theme-transition {
             transition: all 0.3s ease !important;
-        }}
+        }
         
-        .hover-lift:hover {{
+        .hover-lift:hover {
             transform: translateY(-4px);
             box-shadow: var(--shadow-lg);
-        }}
+        }
         
-        .hover-scale:hover {{
+        .hover-scale:hover {
             transform: scale(1.02);
-        }}
+        }
         
         /* === OVERRIDE NICEGUI === */
-        .q-page {{
+        .q-page {
             background-color: var(--theme-background) !important;
-        }}
+        }
         
-        .q-card {{
+        .q-card {
             background-color: var(--theme-card-background) !important;
             color: var(--theme-text) !important;
-        }}
+        }
         
-        .q-btn--standard {{
+        .q-btn--standard {
             background-color: var(--theme-primary) !important;
             color: var(--theme-text-inverse) !important;
-        }}
+        }
         
-        .q-btn--outline {{
+        .q-btn--outline {
             border-color: var(--theme-primary) !important;
             color: var(--theme-primary) !important;
-        }}
+        }
         
         /* === FORM FIELDS FIXES === */
         
         /* Input fields - Text color */
         .q-input,
         .q-select,
-        .q-textarea {{
+        .q-textarea {
             color: var(--theme-text) !important;
-        }}
+        }
         
         /* Input native text (le texte que l'utilisateur tape) */
         .q-field__native,
-        .q-field__input {{
+        .q-field__input {
             color: var(--theme-text) !important;
-        }}
+        }
         
         /* Labels des champs */
-        .q-field__label {{
+        .q-field__label {
             color: var(--theme-text-secondary) !important;
-        }}
+        }
         
         /* Label en focus */
-        .q-field--focused .q-field__label {{
+        .q-field--focused .q-field__label {
             color: var(--theme-primary) !important;
-        }}
+        }
         
         /* Placeholder text */
         .q-field__native::placeholder,
-        .q-field__input::placeholder {{
+        .q-field__input::placeholder {
             color: var(--theme-text-muted) !important;
             opacity: 0.7 !important;
-        }}
+        }
         
         /* Bordures des champs outlined */
-        .q-field--outlined .q-field__control:before {{
+        .q-field--outlined .q-field__control:before {
             border-color: var(--theme-border) !important;
-        }}
+        }
         
-        .q-field--outlined .q-field__control:hover:before {{
+        .q-field--outlined .q-field__control:hover:before {
             border-color: var(--theme-primary) !important;
-        }}
+        }
         
-        .q-field--outlined.q-field--focused .q-field__control:before {{
+        .q-field--outlined.q-field--focused .q-field__control:before {
             border-color: var(--theme-border-focus) !important;
-        }}
+        }
         
         /* Background des champs */
-        .q-field--outlined .q-field__control {{
+        .q-field--outlined .q-field__control {
             background-color: var(--theme-surface) !important;
-        }}
+        }
         
         /* Select dropdown */
-        .q-select .q-field__native {{
+        .q-select .q-field__native {
             color: var(--theme-text) !important;
-        }}
+        }
         
         /* Select dropdown arrow */
-        .q-select .q-field__append {{
+        .q-select .q-field__append {
             color: var(--theme-text-secondary) !important;
-        }}
+        }
         
         /* Menu dropdown */
-        .q-menu {{
+        .q-menu {
             background-color: var(--theme-card-background) !important;
             color: var(--theme-text) !important;
             border: 1px solid var(--theme-border) !important;
-        }}
+        }
         
         /* Items dans le dropdown */
-        .q-item {{
+        .q-item {
             color: var(--theme-text) !important;
-        }}
+        }
         
-        .q-item:hover {{
+        .q-item:hover {
             background-color: var(--theme-hover) !important;
-        }}
+        }
         
-        .q-item--active {{
+        .q-item--active {
             background-color: var(--theme-primary) !important;
             color: var(--theme-text-inverse) !important;
-        }}
+        }
         
         /* === SCROLLBAR === */
-        ::-webkit-scrollbar {{
+        ::-webkit-scrollbar {
             width: 8px;
-        }}
+        }
         
-        ::-webkit-scrollbar-track {{
+        ::-webkit-scrollbar-track {
             background: var(--theme-surface);
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb {{
+        ::-webkit-scrollbar-thumb {
             background: var(--theme-border);
             border-radius: var(--radius-full);
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb:hover {{
+        ::-webkit-scrollbar-thumb:hover {
             background: var(--theme-primary);
-        }}
+        }
         
         /* === UTILITAIRES RESPONSIVE === */
-        @media (max-width: 640px) {{
-            .responsive-text {{
+        @media (max-width: 640px) {
+            .responsive-text {
                 font-size: 0.875rem;
-            }}
+            }
             
-            .responsive-padding {{
+            .responsive-padding {
                 padding: var(--spacing-sm);
-            }}
-        }}
-        """
+            }
+        }
+        """)
+
+# Repli si window.__setTheme (défini dans le <head>) est absent de la page:
+# data-theme et classe de préférence posés directement
+_SET_THEME_FALLBACK_JS = """function(preference) {
+        const theme = preference === 'auto'
+            ? (window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light')
+            : preference;
+        localStorage.setItem('theme_preference', preference);
+        const root = document.documentElement;
+        root.setAttribute('data-theme', theme);
+        root.classList.remove('theme-auto', 'theme-light', 'theme-dark');
+        root.classList.add('theme-' + preference);
+    }"""
+
+# Appels précalculés à window.__setTheme pour chaque préférence.
+# Le thème effectif d'une préférence forcée est la préférence elle-même, et la
+# préférence automatique est résolue dans le navigateur.
+_UPDATE_THEME_JS: Dict[ThemePreference, str] = {
+    # Les champs de formulaire lisent les variables CSS (#theme-vars-css et règles à haute
+    # spécificité): le changement de data-theme suffit, sans parcours du DOM ni reflow forcé
+    preference: f"(window.__setTheme || {_SET_THEME_FALLBACK_JS})('{preference.value}');"
+    f"console.log('Theme updated successfully (preference: {preference.value})');"
+    for preference in ThemePreference
+}
+
+# Rafraîchissement des champs de formulaire en phases séparées: toutes les lectures du DOM,
+# puis toutes les écritures dans une frame, puis le nettoyage (pas de reflow par élément)
+_FORM_FIELDS_REFRESH_JS = """
+    (function() {
+        const selector = '.q-field__native, .q-field__input, .q-field__label, '
+            + '.q-checkbox__label, .q-radio__label';
+        // Lecture: une seule requête pour tous les sélecteurs
+        const elements = Array.from(document.querySelectorAll(selector));
+        // Écriture: un seul passage, dans la prochaine frame
+        requestAnimationFrame(() => {
+            elements.forEach(element => {
+                element.style.color = '';
+                element.classList.add('theme-refresh');
+            });
+            // Nettoyage après l'application des styles
+            setTimeout(() => {
+                elements.forEach(element => element.classList.remove('theme-refresh'));
+            }, 10);
+        });
+    })();
+"""
+
+# Palette de couleurs du thème clair
+_LIGHT_COLORS: Mapping[str, str] = MappingProxyType({
+    # Couleurs principales
+    'primary': '#10b981',        # Vert principal
+    'primary_dark': '#059669',   # Vert foncé pour hover
+    'primary_light': '#34d399',  # Vert clair
+    'secondary': '#6366f1',      # Indigo
+    'secondary_dark': '#4f46e5', # Indigo foncé
+    'accent': '#f59e0b',         # Amber
     
-    def apply_theme(self):
-        """Appliquer le thème à l'interface (SANS JavaScript pendant l'init)"""
-        # Charger les préférences (sans JavaScript)
-        self.load_theme_preferences()
+    # Couleurs de fond et surface
+    'background': '#ffffff',
+    'surface': '#f8fafc',        # Gris très clair
+    'surface_elevated': '#ffffff',
+    'card_background': '#ffffff',
+    
+    # Texte
+    'text': '#1f2937',           # Gris très foncé
+    'text_secondary': '#6b7280', # Gris moyen
+    'text_muted': '#9ca3af',     # Gris clair
+    'text_inverse': '#ffffff',   # Blanc pour contraste
+    
+    # Bordures
+    'border': '#e5e7eb',         # Gris clair pour bordures
+    'border_focus': '#10b981',   # Vert pour focus
+    'divider': '#f3f4f6',        # Gris très clair pour dividers
+    
+    # États
+    'success': '#10b981',        # Vert
+    'warning': '#f59e0b',        # Amber
+    'error': '#ef4444',          # Rouge
+    'info': '#3b82f6',           # Bleu
+    
+    # États de couleur de fond
+    'success_bg': '#f0fdf4',     # Vert très clair
+    'warning_bg': '#fffbeb',     # Amber très clair
+    'error_bg': '#fef2f2',       # Rouge très clair
+    'info_bg': '#eff6ff',        # Bleu très clair
+    
+    # Hover states
+    'hover': '#f9fafb',          # Gris très léger
+    'hover_primary': '#059669',  # Vert foncé
+    'hover_secondary': '#4f46e5', # Indigo foncé
+    
+    # Gradients
+    'gradient_primary': 'linear-gradient(135deg, #10b981, #34d399)',
+    'gradient_secondary': 'linear-gradient(135deg, #6366f1, #8b5cf6)',
+    'gradient_hero': 'linear-gradient(135deg, #10b981, #34d399)',
+})
+
+# Palette de couleurs du thème sombre (adaptée pour le dark mode)
+_DARK_COLORS: Mapping[str, str] = MappingProxyType({
+    # Couleurs principales (adaptées pour le dark mode)
+    'primary': '#34d399',        # Vert plus clair pour le dark
+    'primary_dark': '#10b981',   # Vert standard pour hover
+    'primary_light': '#6ee7b7',  # Vert très clair
+    'secondary': '#818cf8',      # Indigo plus clair
+    'secondary_dark': '#6366f1', # Indigo standard
+    'accent': '#fbbf24',         # Amber plus clair
+    
+    # Couleurs de fond et surface
+    'background': '#111827',     # Gris très foncé
+    'surface': '#1f2937',        # Gris foncé
+    'surface_elevated': '#374151', # Gris moyen foncé
+    'card_background': '#1f2937',
+    
+    # Texte
+    'text': '#f9fafb',           # Blanc cassé
+    'text_secondary': '#d1d5db', # Gris clair
+    'text_muted': '#9ca3af',     # Gris moyen
+    'text_inverse': '#111827',   # Noir pour contraste
+    
+    # Bordures
+    'border': '#374151',         # Gris moyen pour bordures
+    'border_focus': '#34d399',   # Vert pour focus
+    'divider': '#374151',        # Gris moyen pour dividers
+    
+    # États
+    'success': '#34d399',        # Vert clair
+    'warning': '#fbbf24',        # Amber clair
+    'error': '#f87171',          # Rouge clair
+    'info': '#60a5fa',           # Bleu clair
+    
+    # États de couleur de fond
+    'success_bg': '#064e3b',     # Vert très foncé
+    'warning_bg': '#78350f',     # Amber très foncé
+    'error_bg': '#7f1d1d',       # Rouge très foncé
+    'info_bg': '#1e3a8a',        # Bleu très foncé
+    
+    # Hover states
+    'hover': '#374151',          # Gris moyen
+    'hover_primary': '#10b981',  # Vert standard
+    'hover_secondary': '#6366f1', # Indigo standard
+    
+    # Gradients
+    'gradient_primary': 'linear-gradient(135deg, #34d399, #6ee7b7)',
+    'gradient_secondary': 'linear-gradient(135deg, #818cf8, #a78bfa)',
+    'gradient_hero': 'linear-gradient(135deg, #34d399, #6ee7b7)',
+})
+
+# Tailles et espacements centralisés
+_SPACING: Mapping[str, str] = MappingProxyType({
+    'xs': '0.25rem',    # 4px
+    'sm': '0.5rem',     # 8px
+    'md': '1rem',       # 16px
+    'lg': '1.5rem',     # 24px
+    'xl': '2rem',       # 32px
+    '2xl': '2.5rem',    # 40px
+    '3xl': '3rem',      # 48px
+    '4xl': '4rem',      # 64px
+})
+
+# Rayons de bordure
+_BORDER_RADIUS: Mapping[str, str] = MappingProxyType({
+    'none': '0',
+    'sm': '0.25rem',    # 4px
+    'md': '0.375rem',   # 6px
+    'lg': '0.5rem',     # 8px
+    'xl': '0.75rem',    # 12px
+    '2xl': '1rem',      # 16px
+    'full': '9999px',   # Cercle parfait
+})
+
+# Ombres
+_SHADOWS: Mapping[str, str] = MappingProxyType({
+    'none': 'none',
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+})
+
+# Variables CSS partagées par les deux thèmes, rendues une seule fois à l'import
+_SHARED_VARS_CSS = '; '.join([
+    *(f"--spacing-{name}: {value}" for name, value in _SPACING.items()),
+    *(f"--radius-{name}: {value}" for name, value in _BORDER_RADIUS.items()),
+    *(f"--shadow-{name}: {value}" for name, value in _SHADOWS.items()),
+])
+
+# Classes CSS des boutons
+_BUTTON_BASE_CLASSES = 'transition-all duration-200 font-medium rounded-lg'
+
+_BUTTON_VARIANT_CLASSES = {
+    'primary': 'btn-primary',
+    'secondary': 'btn-secondary',
+    'outline': 'btn-outline',
+    'ghost': 'btn-ghost'
+}
+
+_BUTTON_SIZE_CLASSES = {
+    'sm': 'px-3 py-1 text-sm',
+    'md': 'px-4 py-2',
+    'lg': 'px-6 py-3 text-lg',
+    'xl': 'px-8 py-4 text-xl'
+}
+
+# Classes CSS du texte
+_TEXT_VARIANT_CLASSES = {
+    'main': 'text-main',
+    'muted': 'text-muted',
+    'light': 'text-light',
+    'primary': 'text-primary',
+    'secondary': 'text-secondary',
+    'success': 'text-success',
+    'warning': 'text-warning',
+    'error': 'text-error',
+    'info': 'text-info'
+}
+
+_TEXT_SIZE_CLASSES = {
+    'xs': 'text-xs',
+    'sm': 'text-sm',
+    'base': 'text-base',
+    'lg': 'text-lg',
+    'xl': 'text-xl',
+    '2xl': 'text-2xl',
+    '3xl': 'text-3xl',
+    '4xl': 'text-4xl'
+}
+
+# Tables de classes précalculées à l'import (domaines finis: toutes les combinaisons)
+_BUTTON_CLASS_TABLE: Mapping[Tuple[str, str], str] = MappingProxyType({
+    (variant, size): " ".join((_BUTTON_BASE_CLASSES, variant_classes, size_classes))
+    for variant, variant_classes in _BUTTON_VARIANT_CLASSES.items()
+    for size, size_classes in _BUTTON_SIZE_CLASSES.items()
+})
+
+_CARD_CLASS_TABLE: Mapping[Tuple[bool, bool], str] = MappingProxyType({
+    (elevated, hover): ' '.join(
+        ['card'] + (['card-elevated'] if elevated else []) + (['hover-lift'] if hover else [])
+    )
+    for elevated in (False, True)
+    for hover in (False, True)
+})
+
+_TEXT_CLASS_TABLE: Mapping[Tuple[str, str], str] = MappingProxyType({
+    (variant, size): " ".join((variant_classes, size_classes))
+    for variant, variant_classes in _TEXT_VARIANT_CLASSES.items()
+    for size, size_classes in _TEXT_SIZE_CLASSES.items()
+})
+
+def button_classes(variant: str = 'primary', size: str = 'md') -> str:
+    """Classes CSS d'un bouton (variante ou taille inconnue: valeurs par défaut)"""
+    classes = _BUTTON_CLASS_TABLE.get((variant, size))
+    if classes is None:
+        classes = _BUTTON_CLASS_TABLE[(
+            variant if variant in _BUTTON_VARIANT_CLASSES else 'primary',
+            size if size in _BUTTON_SIZE_CLASSES else 'md'
+        )]
+    return classes
+
+def card_classes(elevated: bool = False, hover: bool = True) -> str:
+    """Classes CSS d'une carte"""
+    return _CARD_CLASS_TABLE[(bool(elevated), bool(hover))]
+
+def text_classes(variant: str = 'main', size: str = 'base') -> str:
+    """Classes CSS d'un texte (variante ou taille inconnue: valeurs par défaut)"""
+    classes = _TEXT_CLASS_TABLE.get((variant, size))
+    if classes is None:
+        classes = _TEXT_CLASS_TABLE[(
+            variant if variant in _TEXT_VARIANT_CLASSES else 'main',
+            size if size in _TEXT_SIZE_CLASSES else 'base'
+        )]
+    return classes
+
+class ThemeManager:
+    # Attributs fixes: pas de __dict__ par instance, accès aux attributs plus direct
+    __slots__ = (
+        # État du thème
+        '_current_theme', '_active_colors', 'theme_preference', 'system_theme',
+        # Palettes et valeurs de design
+        'theme_colors',
+        # CSS et HTML précalculés
+        '_css_ready_colors', '_light_vars_css', '_dark_vars_css',
+        '_cached_css', '_vars_css', '_deferred_css_url', '_head_html', '_page_head_html',
+        # Application différée du thème
+        '_pending_applies', '_system_debounce', '_pending_system_theme',
+        '_pending_system_storage',
+        '_refresh_pending',
+    )
+    
+    # Tailles, rayons et ombres: identiques pour toutes les instances (lecture seule, partagés)
+    spacing = _SPACING
+    border_radius = _BORDER_RADIUS
+    shadows = _SHADOWS
+    
+    def __init__(self):
+        # Palette de couleurs centralisée (palettes partagées en lecture seule:
+        # get_colors() peut les exposer sans copie)
+        self.theme_colors = {
+            Theme.LIGHT: _LIGHT_COLORS,
+            Theme.DARK: _DARK_COLORS,
+        }
+        
+        # État du thème (current_theme met aussi à jour la palette active)
+        self.current_theme = Theme.LIGHT
+        self.theme_preference = ThemePreference.AUTO  # Par défaut, suit le système
+        self.system_theme = Theme.LIGHT  # Thème détecté du système
+        
+        # Couleurs prêtes pour le CSS: noms convertis en kebab-case une seule fois
+        self._css_ready_colors: Dict[Theme, Tuple[Tuple[str, str], ...]] = {
+            theme: tuple(
+                (f"--theme-{name.replace('_', '-')}", color) for name, color in colors.items()
+            )
+            for theme, colors in self.theme_colors.items()
+        }
+        self._light_vars_css = self._build_color_vars(Theme.LIGHT)
+        self._dark_vars_css = self._build_color_vars(Theme.DARK)
+        
+        # CSS rendu une seule fois: les palettes ne changent pas après l'initialisation
+        # et la feuille contient les deux thèmes (pas de cache par thème nécessaire)
+        self._vars_css = minify_css(self._build_vars_css())
+        self._cached_css = self._vars_css + _BASE_CSS + _DEFERRED_CSS
+        self._deferred_css_url: Optional[str] = None
+        self._head_html: Optional[str] = None
+        # Script d'amorçage des pages par état (préférence, thème): au plus six variantes
+        self._page_head_html: Dict[Tuple[ThemePreference, Theme], str] = {}
+        
+        # Application différée du thème (regroupe les changements rapprochés)
+        # Application en attente par client (id du client -> message): les changements
+        # rapprochés d'un même client sont regroupés, sans effet sur les autres clients
+        self._pending_applies: Dict[str, Optional[str]] = {}
+        self._system_debounce: Optional[asyncio.TimerHandle] = None
+        self._pending_system_theme = self.system_theme
+        self._pending_system_storage = None
+        self._refresh_pending = False
+    
+    @property
+    def current_theme(self) -> Theme:
+        """Thème actuellement appliqué"""
+        return self._current_theme
+    
+    @current_theme.setter
+    def current_theme(self, theme: Theme):
+        """Définir le thème actuel et pointer directement sur sa palette"""
+        self._current_theme = theme
+        self._active_colors = self.theme_colors[theme]
+    
+    def __getitem__(self, color_name: str) -> str:
+        """Accès direct à une couleur du thème actuel: theme_manager['primary']"""
+        return self._active_colors.get(color_name, '#000000')
+    
+    def _build_color_vars(self, theme: Theme) -> str:
+        """Construire le bloc de variables CSS de couleur d'un thème"""
+        return '; '.join(f"{var_name}: {color}" for var_name, color in self._css_ready_colors[theme])
+
+    def load_theme_preferences(self):
+        """Charger les préférences de thème depuis le storage"""
+        try:
+            # Charger la préférence utilisateur
+            stored_preference = app.storage.user.get('theme_preference', 'auto')
+            self.theme_preference = _PREF_BY_VALUE.get(stored_preference, ThemePreference.AUTO)
+            
+            # Charger le thème système détecté (si disponible)
+            stored_system_theme = app.storage.user.get('system_theme', 'light')
+            self.system_theme = _THEME_BY_VALUE.get(stored_system_theme, Theme.LIGHT)
+            
+            # Appliquer le thème approprié
+            self.apply_theme_preference()
+            
+        except RuntimeError:
+            # Fallback si le storage n'est pas disponible
+            self.theme_preference = ThemePreference.AUTO
+            self.system_theme = Theme.LIGHT
+            self.current_theme = Theme.LIGHT
+
+    def load_theme(self):
+        """Méthode de compatibilité - redirige vers load_theme_preferences"""
+        return self.load_theme_preferences()
+
+    def save_theme_preferences(self, user_storage=None):
+        """Sauvegarder les préférences de thème (dans le storage donné ou celui de la requête)"""
+        try:
+            if user_storage is None:
+                user_storage = app.storage.user
+            values = {
+                'theme_preference': self.theme_preference.value,
+                'system_theme': self.system_theme.value,
+                'current_theme': self.current_theme.value,
+            }
+            # Ne rien réécrire si le storage contient déjà ces valeurs
+            if all(user_storage.get(key) == value for key, value in values.items()):
+                return
+            
+            # Une seule mise à jour: une seule notification/persistance du storage
+            user_storage.update(values)
+        except (RuntimeError, ValueError):
+            logger.warning("Impossible de sauvegarder les préférences de thème")
+
+    def apply_theme_preference(self):
+        """Appliquer le thème selon la préférence utilisateur"""
+        if self.theme_preference == ThemePreference.AUTO:
+            # Suivre le thème système
+            self.current_theme = self.system_theme
+        elif self.theme_preference == ThemePreference.LIGHT:
+            # Forcer le thème clair
+            self.current_theme = Theme.LIGHT
+        elif self.theme_preference == ThemePreference.DARK:
+            # Forcer le thème sombre
+            self.current_theme = Theme.DARK
+
+    def set_system_theme(self, system_theme: Theme):
+        """Mettre à jour le thème système détecté (rafales de changements regroupées)"""
+        # Notification répétée sans changement (par rapport au dernier thème reçu,
+        # appliqué ou en attente): rien à écrire ni à appliquer
+        latest = self._pending_system_theme if self._system_debounce is not None else self.system_theme
+        if system_theme == latest:
+            return
+        self._pending_system_theme = system_theme
+        
+        # Storage de l'utilisateur capturé pendant la requête: le changement est
+        # appliqué plus tard, hors de tout contexte de requête ou de page
+        try:
+            self._pending_system_storage = app.storage.user
+        except RuntimeError:
+            self._pending_system_storage = None
+        
+        # Debounce sur la boucle d'événements (les routes API n'ont pas de client NiceGUI
+        # pour un ui.timer): seul le dernier changement d'une rafale est appliqué
+        if self._system_debounce is not None:
+            self._system_debounce.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Hors de la boucle d'événements: application immédiate
+            self._system_debounce = None
+            self._apply_system_change()
+            return
+        self._system_debounce = loop.call_later(0.25, self._apply_system_change)
+    
+    def _apply_system_change(self):
+        """Appliquer le dernier thème système reçu"""
+        system_theme = self._pending_system_theme
+        user_storage = self._pending_system_storage
+        self._system_debounce = None
+        self._pending_system_storage = None
+        self.system_theme = system_theme
         
-        # Générer et appliquer le CSS
-        css_content = self.generate_css()
-        ui.add_head_html(f'<style id="theme-css">{css_content}</style>')
+        # Si l'utilisateur suit le système, suivre le changement côté serveur.
+        # Le navigateur a déjà appliqué le thème (data-theme): pas de script ni de notification.
+        if self.theme_preference == ThemePreference.AUTO:
+            self.current_theme = system_theme
         
-        # Ajouter les styles à haute spécificité
+        if user_storage is not None:
+            self.save_theme_preferences(user_storage)
+
+    def toggle_theme(self):
+        """Basculer entre les thèmes (cycle: auto → light → dark → auto)"""
+        self.theme_preference, forced_theme, message = _TOGGLE_NEXT[self.theme_preference]
+        if forced_theme is None:
+            # Retour en automatique: suivre le thème système
+            self.current_theme = self.system_theme
+            theme_name = 'sombre' if self.current_theme == Theme.DARK else 'clair'
+            message = f"Thème automatique ({theme_name})"
+        else:
+            self.current_theme = forced_theme
+        
+        self._schedule_theme_apply(message)
+
+    def set_theme_preference(self, preference: ThemePreference):
+        """Définir une préférence de thème spécifique"""
+        # Re-clic sur la préférence déjà active: rien à sauvegarder ni à appliquer
+        if preference == self.theme_preference:
+            return
+        
+        self.theme_preference = preference
+        self.apply_theme_preference()
+        self._schedule_theme_apply()
+
+    def _schedule_theme_apply(self, message: Optional[str] = None):
+        """Programmer l'application du thème (les appels rapprochés d'un client sont regroupés)"""
+        client_id = context.client.id
+        if client_id not in self._pending_applies:
+            # Timer créé dans le contexte du client: script et notification partent vers lui
+            ui.timer(0.05, lambda: self._flush_theme_apply(client_id), once=True)
+        self._pending_applies[client_id] = message
+
+    def _flush_theme_apply(self, client_id: str):
+        """Appliquer l'état final du thème d'un client: une sauvegarde, un script, une notification"""
+        message = self._pending_applies.pop(client_id, None)
+        
+        self.save_theme_preferences()
+        self.update_theme_dynamically()
         self.ensure_high_css_specificity()
         
-        # Programmer la détection système pour après l'initialisation
-        ui.timer(0.1, lambda: self.delayed_system_detection(), once=True)
+        if message:
+            ui.notify(message, type='info')
+
+    def get_theme_status(self) -> Dict[str, str]:
+        """Obtenir le statut complet du thème"""
+        return {
+            'current_theme': self.current_theme.value,
+            'theme_preference': self.theme_preference.value,
+            'system_theme': self.system_theme.value,
+            'is_following_system': self.theme_preference == ThemePreference.AUTO
+        }
+
+    def get_color(self, color_name: str) -> str:
+        """Obtenir une couleur du thème actuel"""
+        return self._active_colors.get(color_name, '#000000')
+    
+    def get_colors(self) -> Mapping[str, str]:
+        """Obtenir toutes les couleurs du thème actuel (vue en lecture seule, utiliser dict() pour une copie)"""
+        return self._active_colors
+    
+    def get_spacing(self, size: str) -> str:
+        """Obtenir une valeur d'espacement"""
+        return self.spacing.get(size, '1rem')
+    
+    def get_border_radius(self, size: str) -> str:
+        """Obtenir un rayon de bordure"""
+        return self.border_radius.get(size, '0.375rem')
+    
+    def get_shadow(self, size: str) -> str:
+        """Obtenir une ombre"""
+        return self.shadows.get(size, 'none')
+    
+    def generate_css(self) -> str:
+        """CSS des deux thèmes, précalculé (le thème actif est choisi via data-theme)"""
+        return self._cached_css
+    
+    def generate_critical_css(self) -> str:
+        """CSS critique (variables des deux thèmes + styles de base), injecté en ligne dans <head>"""
+        return self.generate_vars_css() + self.generate_base_css()
+    
+    def generate_vars_css(self) -> str:
+        """Variables CSS des deux thèmes (#theme-vars-css, jamais modifié au toggle)"""
+        return self._vars_css
+    
+    def generate_base_css(self) -> str:
+        """Styles de base statiques (#theme-static-css, analysés une seule fois)"""
+        return _BASE_CSS
+    
+    def generate_deferred_css(self) -> str:
+        """CSS non critique (classes utilitaires, overrides NiceGUI), chargé après le premier rendu"""
+        return _DEFERRED_CSS
+    
+    def _build_vars_css(self) -> str:
+        """Construire les blocs de variables des deux thèmes"""
+        return _VARS_CSS_TEMPLATE.substitute(
+            shared_vars=_SHARED_VARS_CSS,
+            light_vars=self._light_vars_css,
+            dark_vars=self._dark_vars_css,
+        )
+    
+    def apply_theme(self, extra_head_html: str = ''):
+        """Appliquer le thème à l'interface (SANS JavaScript pendant l'init)"""
+        # Charger les préférences (sans JavaScript)
+        self.load_theme_preferences()
+        
+        # Un seul ajout au <head> (thème + HTML statique de l'application), construit une fois.
+        # Appelé hors de toute page: partagé pour être servi à toutes les pages
+        ui.add_head_html(self._build_head_html() + extra_head_html, shared=True)
+    
+    def apply_page_theme(self):
+        """Amorcer le thème d'une page depuis le storage de l'utilisateur (au rendu de la page)"""
+        self.load_theme_preferences()
+        ui.add_head_html(self._build_page_head_html())
+    
+    def _build_head_html(self) -> str:
+        """Construire le HTML de thème partagé par toutes les pages (construit une seule fois)"""
+        if self._head_html is None:
+            deferred_css_url = self._register_deferred_css_route()
+            self._head_html = (
+                # CSS critique en ligne: les deux thèmes, choisis par l'attribut data-theme.
+                # Le toggle ne touche à aucune de ces feuilles: seul l'attribut data-theme change.
+                f'<style id="theme-vars-css">{self.generate_vars_css()}</style>'
+                # Styles de base et styles à haute spécificité des champs: une seule feuille statique
+                f'<style id="theme-static-css">{self.generate_base_css()}{_HIGH_SPECIFICITY_RULES}</style>'
+                f'<script>{_THEME_SHARED_JS}</script>'
+                # Reste du CSS chargé sans bloquer le rendu
+                f'<link id="theme-deferred-css" rel="preload" as="style" href="{deferred_css_url}" '
+                f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+                f'<noscript><link rel="stylesheet" href="{deferred_css_url}"></noscript>'
+            )
+        return self._head_html
+    
+    def _build_page_head_html(self) -> str:
+        """Script d'amorçage de la page pour l'état courant (mis en cache par état)"""
+        state = (self.theme_preference, self.current_theme)
+        page_head_html = self._page_head_html.get(state)
+        if page_head_html is None:
+            page_head_html = self._page_head_html[state] = '<script>' + _THEME_SEED_JS.substitute(
+                server_preference=self.theme_preference.value,
+                server_theme=self.current_theme.value,
+            ) + '</script>'
+        return page_head_html
+    
+    def _register_deferred_css_route(self) -> str:
+        """Servir le CSS non critique comme feuille de style (route enregistrée une seule fois)"""
+        if self._deferred_css_url is None:
+            deferred_css = self.generate_deferred_css()
+            # La version dans l'URL permet une mise en cache longue côté navigateur
+            version = hashlib.md5(deferred_css.encode('utf-8')).hexdigest()[:8]
+            self._deferred_css_url = f'{DEFERRED_CSS_PATH}?v={version}'
+            
+            @app.get(DEFERRED_CSS_PATH, include_in_schema=False)
+            def theme_deferred_css():
+                return Response(
+                    content=deferred_css,
+                    media_type='text/css',
+                    headers={'Cache-Control': 'public, max-age=31536000, immutable'}
+                )
+        
+        return self._deferred_css_url
     
     def update_theme_dynamically(self):
         """Mettre à jour le thème de manière dynamique (pour le toggle)"""
         try:
-            # Générer le nouveau CSS
-            css_content = self.generate_css()
-            
-            # Supprimer l'ancien style et ajouter le nouveau via JavaScript
-            ui.run_javascript(f"""
-                // Supprimer l'ancien style
-                const existingStyle = document.getElementById('theme-css');
-                if (existingStyle) {{
-                    existingStyle.remove();
-                }}
-                
-                // Ajouter le nouveau style
-                const style = document.createElement('style');
-                style.id = 'theme-css';
-                style.textContent = `{css_content}`;
-                document.head.appendChild(style);
-                
-                // Mettre à jour la classe de thème
-                document.documentElement.className = 'theme-{self.theme_preference.value}';
-                
-                // Forcer la mise à jour des champs de formulaire existants
-                const fields = document.querySelectorAll('.q-field__native, .q-field__input, .q-field__label');
-                fields.forEach(field => {{
-                    field.style.color = '';
-                    field.offsetHeight; // Force reflow
-                }});
-                
-                console.log('Theme updated successfully to {self.current_theme.value} (preference: {self.theme_preference.value})');
-            """)
-        except:
-            # Si JavaScript échoue, utiliser la méthode simple
-            self.apply_theme()
+            # La feuille de style contient les deux thèmes: il suffit de basculer data-theme
+            ui.run_javascript(_UPDATE_THEME_JS[self.theme_preference])
+        except Exception as e:
+            # Pas de réinjection du CSS: le <head> contient déjà les deux thèmes
+            logger.warning("Mise à jour dynamique du thème échouée: %s", e)
     
     def get_theme_icon(self) -> str:
         """Obtenir l'icône du thème selon la préférence"""
@@ -746,150 +1128,48 @@ class ThemeManager:
     
     def get_button_classes(self, variant: str = 'primary', size: str = 'md') -> str:
         """Obtenir les classes CSS pour un bouton"""
-        base_classes = 'transition-all duration-200 font-medium rounded-lg'
-        
-        variant_classes = {
-            'primary': 'btn-primary',
-            'secondary': 'btn-secondary',
-            'outline': 'btn-outline',
-            'ghost': 'btn-ghost'
-        }
-        
-        size_classes = {
-            'sm': 'px-3 py-1 text-sm',
-            'md': 'px-4 py-2',
-            'lg': 'px-6 py-3 text-lg',
-            'xl': 'px-8 py-4 text-xl'
-        }
-        
-        return f"{base_classes} {variant_classes.get(variant, 'btn-primary')} {size_classes.get(size, 'px-4 py-2')}"
+        return button_classes(variant, size)
     
     def get_card_classes(self, elevated: bool = False, hover: bool = True) -> str:
         """Obtenir les classes CSS pour une carte"""
-        classes = ['card']
-        
-        if elevated:
-            classes.append('card-elevated')
-        
-        if hover:
-            classes.append('hover-lift')
-        
-        return ' '.join(classes)
+        return card_classes(elevated, hover)
     
     def get_text_classes(self, variant: str = 'main', size: str = 'base') -> str:
         """Obtenir les classes CSS pour le texte"""
-        variant_classes = {
-            'main': 'text-main',
-            'muted': 'text-muted',
-            'light': 'text-light',
-            'primary': 'text-primary',
-            'secondary': 'text-secondary',
-            'success': 'text-success',
-            'warning': 'text-warning',
-            'error': 'text-error',
-            'info': 'text-info'
-        }
-        
-        size_classes = {
-            'xs': 'text-xs',
-            'sm': 'text-sm',
-            'base': 'text-base',
-            'lg': 'text-lg',
-            'xl': 'text-xl',
-            '2xl': 'text-2xl',
-            '3xl': 'text-3xl',
-            '4xl': 'text-4xl'
-        }
-        
-        return f"{variant_classes.get(variant, 'text-main')} {size_classes.get(size, 'text-base')}"
+        return text_classes(variant, size)
     
     def force_refresh_form_fields(self):
-        """Forcer la mise à jour de tous les champs de formulaire"""
+        """Forcer la mise à jour de tous les champs de formulaire (appels rapprochés regroupés)"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            ui.timer(0, self._flush_form_fields_refresh, once=True)
+    
+    def _flush_form_fields_refresh(self):
+        """Envoyer un seul script de rafraîchissement des champs"""
+        self._refresh_pending = False
         try:
-            ui.run_javascript("""
-                // Fonction pour forcer la mise à jour des styles
-                function refreshFormFields() {
-                    console.log('Refreshing form fields...');
-                    
-                    // Sélectionner tous les éléments de formulaire
-                    const selectors = [
-                        '.q-field__native',
-                        '.q-field__input', 
-                        '.q-field__label',
-                        '.q-select .q-field__native',
-                        '.q-textarea .q-field__native',
-                        '.q-checkbox__label',
-                        '.q-radio__label'
-                    ];
-                    
-                    selectors.forEach(selector => {
-                        const elements = document.querySelectorAll(selector);
-                        console.log(`Found ${elements.length} elements for ${selector}`);
-                        
-                        elements.forEach(element => {
-                            // Forcer un recalcul des styles
-                            element.style.color = '';
-                            element.offsetHeight; // Force reflow
-                            
-                            // Ajouter une classe temporaire pour forcer la mise à jour
-                            element.classList.add('theme-refresh');
-                            setTimeout(() => {
-                                element.classList.remove('theme-refresh');
-                            }, 10);
-                        });
-                    });
-                    
-                    console.log('Form fields refresh completed');
-                }
-                
-                // Exécuter immédiatement
-                refreshFormFields();
-                
-                // Et après un petit délai pour s'assurer que le CSS est appliqué
-                setTimeout(refreshFormFields, 100);
-            """)
+            ui.run_javascript(_FORM_FIELDS_REFRESH_JS)
         except Exception as e:
-            print(f"Force refresh error: {e}")
+            logger.warning("Rafraîchissement des champs de formulaire échoué: %s", e)
     
     def ensure_high_css_specificity(self):
         """S'assurer que nos styles ont une spécificité plus élevée"""
-        ui.add_head_html("""
-        <style>
-        /* Force higher specificity for form fields */
-        html body .q-field .q-field__native,
-        html body .q-field .q-field__input {
-            color: var(--theme-text) !important;
-        }
-        
-        html body .q-field .q-field__label {
-            color: var(--theme-text-secondary) !important;
-        }
-        
-        html body .q-field--focused .q-field__label {
-            color: var(--theme-primary) !important;
-        }
-        
-        html body .q-select .q-field__native {
-            color: var(--theme-text) !important;
-        }
-        
-        html body .q-textarea .q-field__native {
-            color: var(--theme-text) !important;
-        }
-        
-        /* Placeholder avec spécificité élevée */
-        html body .q-field__native::placeholder,
-        html body .q-field__input::placeholder {
-            color: var(--theme-text-muted) !important;
-            opacity: 0.7 !important;
-        }
-        
-        /* Classe helper pour forcer la mise à jour */
-        .theme-refresh {
-            transition: color 0.1s ease !important;
-        }
-        </style>
-        """)
+        # Déjà inclus dans le <head> injecté par apply_theme
+        if self._head_html is None:
+            ui.add_head_html(_HIGH_SPECIFICITY_CSS)
+
+# Instance globale du gestionnaire de thème (créée au premier accès)
+_theme_manager: Optional[ThemeManager] = None
+
+def get_theme_manager() -> ThemeManager:
+    """Obtenir l'instance globale du gestionnaire de thème"""
+    global _theme_manager
+    if _theme_manager is None:
+        _theme_manager = ThemeManager()
+    return _theme_manager
 
-# Instance globale du gestionnaire de thème
-theme_manager = ThemeManager()
\ No newline at end of file
+def __getattr__(name: str):
+    """Instancier `theme_manager` à la demande (from core.theme import theme_manager)"""
+    if name == 'theme_manager':
+        return get_theme_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,10 @@
+import asyncio
 import os
+import faiss
+import httpx
+import numpy as np
 import pandas as pd
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_ollama import OllamaEmbeddings
 from langchain.docstore.document import Document
@@ -7,26 +12,81 @@ from langchain.docstore.document import Document
 # --- Configuration ---
 CSV_PATH = os.path.join("chatbot", "etablissements_sante_mentale_maroc.csv")
 INDEX_SAVE_PATH = os.path.join("chatbot", "faiss_index")
+EMBEDDING_MODEL = "mxbai-embed-large"
+EMBEDDING_BATCH_SIZE = 64
+# Concurrent embedding requests sent to the Ollama server
+EMBEDDING_CONCURRENCY = 8
+# Same endpoint as OllamaEmbeddings (/api/embed), so index and query vectors match
+OLLAMA_EMBED_URL = "http://localhost:11434/api/embed"
+# HNSW graph parameters (neighbors per node, build and search breadth)
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
 
-def create_document_from_row(row):
-    """Creates a Document object from a row, handling empty values."""
-    parts = []
-    if 'nom' in row and pd.notna(row['nom']):
-        parts.append(f"Nom: {row['nom']}")
-    if 'type_etablissement' in row and pd.notna(row['type_etablissement']):
-        parts.append(f"Type: {row['type_etablissement']}")
-    if 'ville' in row and pd.notna(row['ville']):
-        parts.append(f"Ville: {row['ville']}")
-    if 'adresse' in row and pd.notna(row['adresse']):
-        parts.append(f"Adresse: {row['adresse']}")
-    if 'telephone' in row and pd.notna(row['telephone']):
-        parts.append(f"Téléphone: {row['telephone']}")
-
-    if not parts:
-        return None
-
-    content = "\n".join(parts)
-    return Document(page_content=content, metadata=row.to_dict())
+# Columns used to build the document content, with their labels
+DOCUMENT_FIELDS = (
+    ("nom", "Nom"),
+    ("type_etablissement", "Type"),
+    ("ville", "Ville"),
+    ("adresse", "Adresse"),
+    ("telephone", "Téléphone"),
+)
+CONTENT_COLUMNS = frozenset(column for column, _ in DOCUMENT_FIELDS)
+# Low-cardinality columns stored as categories (integer codes + one copy of each label)
+CATEGORY_COLUMNS = {"type_etablissement": "category", "ville": "category"}
+
+def create_documents(df):
+    """Creates Document objects from the DataFrame rows, skipping rows with no content."""
+    # Resolve the available columns once instead of checking them on every row
+    fields = [(df.columns.get_loc(column), label) for column, label in DOCUMENT_FIELDS if column in df.columns]
+
+    documents = []
+    for values, metadata in zip(df.itertuples(index=False, name=None), df.to_dict("records")):
+        parts = [f"{label}: {values[position]}" for position, label in fields if pd.notna(values[position])]
+        if parts:
+            documents.append(Document(page_content="\n".join(parts), metadata=metadata))
+    return documents
+
+def batched(items, size):
+    """Yields successive chunks of `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+async def embed_concurrently(texts, batch_size=EMBEDDING_BATCH_SIZE, concurrency=EMBEDDING_CONCURRENCY):
+    """Embeds the texts in batches, with several batches in flight on the Ollama server."""
+    semaphore = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def embed_batch(client, batch):
+        nonlocal done
+        async with semaphore:
+            response = await client.post(OLLAMA_EMBED_URL, json={"model": EMBEDDING_MODEL, "input": batch})
+            response.raise_for_status()
+        done += len(batch)
+        print(f"   Embedded {done}/{len(texts)} documents", end="\r", flush=True)
+        return response.json()["embeddings"]
+
+    async with httpx.AsyncClient(timeout=None) as client:
+        # gather keeps the batch order, so vectors stay aligned with texts
+        results = await asyncio.gather(*(embed_batch(client, batch) for batch in batched(texts, batch_size)))
+    print()
+    return [vector for batch_vectors in results for vector in batch_vectors]
+
+def build_hnsw_store(documents, vectors, embeddings):
+    """Builds a FAISS store backed by an HNSW graph (sub-linear search) instead of a flat index."""
+    matrix = np.asarray(vectors, dtype="float32")
+    index = faiss.IndexHNSWFlat(matrix.shape[1], HNSW_NEIGHBORS)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    index.hnsw.efSearch = HNSW_EF_SEARCH
+    index.add(matrix)
+
+    ids = [str(position) for position in range(len(documents))]
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(dict(zip(ids, documents))),
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
 
 if __name__ == "__main__":
     print("🚀 Starting FAISS index creation...")
@@ -34,14 +94,21 @@ if __name__ == "__main__":
     print("This is a one-time process and will take a long time (approx. 30-40 minutes).")
 
     # 1. Read the CSV data
-    df = pd.read_csv(CSV_PATH)
-    documents = [doc for doc in df.apply(create_document_from_row, axis=1) if doc]
+    # Only the columns used for the documents are parsed (the CSV has ~20 more)
+    df = pd.read_csv(
+        CSV_PATH,
+        usecols=lambda column: column in CONTENT_COLUMNS,
+        dtype=CATEGORY_COLUMNS,
+    )
+    documents = create_documents(df)
 
-    # 2. Initialize the embedding model
-    embeddings = OllamaEmbeddings(model="mxbai-embed-large")
+    # 2. Initialize the embedding model (kept for the query path of the saved index)
+    embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
 
-    # 3. Create the FAISS index (this is the slow part)
-    vector_store = FAISS.from_documents(documents, embeddings)
+    # 3. Embed the documents in batches (this is the slow part), then build the HNSW index
+    texts = [doc.page_content for doc in documents]
+    vectors = asyncio.run(embed_concurrently(texts))
+    vector_store = build_hnsw_store(documents, vectors, embeddings)
 
     # 4. Save the completed index to disk
     vector_store.save_local(INDEX_SAVE_PATH)
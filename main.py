@@ -1,194 +1,26 @@
+import logging
+import orjson
+import threading
+from functools import partial
+from importlib import import_module
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
 from nicegui import ui, app
 from pathlib import Path
 
 # Configuration
 from config.settings import settings, create_directories
-from core.theme import theme_manager, ThemePreference, Theme
+from core.theme import theme_manager, Theme, minify_css
 from core.i18n import i18n, _
 
-# Pages
-from pages.home import HomePage
-from pages.articles import ArticlesPage
-from pages.reports import ReportsPage
-from pages.about import AboutPage
-from pages.contact import ContactPage 
-from pages.chatbot import ChatbotPage
-
 # Composants
 from components.navbar import Navbar
 from components.footer import Footer
 
-class MindCareApp:
-    """Application principale MindCare avec détection de thème système et support i18n"""
-    
-    def __init__(self):
-        # Créer les dossiers nécessaires
-        create_directories()
-        
-        # Variables d'état
-        self.current_theme = "light"
-        
-        # Initialiser le système i18n
-        self.initialize_i18n()
-        
-        # Initialiser et appliquer le thème (SANS JavaScript pendant l'init)
-        theme_manager.apply_theme()
-        
-        # Récupérer l'état du thème après initialisation
-        self.current_theme = theme_manager.current_theme.value
-        
-        # Initialiser la navbar avec callbacks
-        self.navbar = Navbar("MindCare", self.current_theme)
-        self.navbar.set_theme_toggle_callback(self.toggle_theme)
-        self.navbar.set_mobile_menu_callback(self.show_mobile_menu)
-
-        # Initialiser la footer avec callbacks
-        self.footer = Footer("MindCare", self.current_theme)
-        
-        # Configurer les routes
-        self.setup_routes()
-        
-        # Configurer les routes API pour la détection système et i18n
-        self.setup_api_routes()
-        
-        # Ajouter le CSS pour le support RTL
-        self.setup_rtl_support()
-    
-    def initialize_i18n(self):
-        """Initialiser le système d'internationalisation"""
-        try:
-            # Charger la langue de l'utilisateur depuis le storage
-            i18n.load_language()
-            
-            # Afficher les statistiques de traduction pour le debug
-            if settings.debug:
-                from core.i18n import print_translation_stats
-                print_translation_stats()
-                
-            print(f"🌐 Système i18n initialisé - Langue: {i18n.get_language()}")
-            
-        except Exception as e:
-            print(f"⚠️ Erreur lors de l'initialisation i18n: {e}")
-            # Utiliser la langue par défaut en cas d'erreur
-            i18n.current_language = settings.default_language
-    
-    def setup_routes(self):
-        """Configuration des routes principales"""
-        
-        @ui.page('/')
-        def index():
-            self.render_page(HomePage())
-        
-        @ui.page('/articles')
-        def articles():
-            self.render_page(ArticlesPage())
-        
-        @ui.page('/reports')
-        def reports():
-            self.render_page(ReportsPage())
-        
-        @ui.page('/about')
-        def about():
-            self.render_page(AboutPage())
-        
-        @ui.page('/contact')
-        def contact():
-            self.render_page(ContactPage())
+logger = logging.getLogger("mindcare")
 
-        @ui.page('/chatbot') 
-        def chatbot():
-            self.render_page(ChatbotPage())
-        
-        # Route pour le changement de langue
-        @ui.page('/lang/{language}')
-        def change_language(language: str):
-            if i18n.set_language(language):
-                # Rediriger vers la page d'accueil après changement
-                ui.navigate.to('/')
-            else:
-                # Langue invalide, retourner à l'accueil
-                ui.navigate.to('/')
-    
-    def setup_api_routes(self):
-        """Configuration des routes API pour la gestion du thème et de la langue"""
-        
-        @app.post('/api/theme/system-detected')
-        async def system_theme_detected(request):
-            """Recevoir la notification de détection du thème système"""
-            try:
-                data = await request.json()
-                system_theme = Theme.DARK if data.get('theme') == 'dark' else Theme.LIGHT
-                
-                # Mettre à jour le thème système dans le manager
-                old_theme = theme_manager.system_theme
-                theme_manager.system_theme = system_theme
-                
-                # Sauvegarder dans le storage
-                theme_manager.save_theme_preferences()
-                
-                # Si l'utilisateur suit le système et que le thème a changé
-                if (theme_manager.theme_preference == ThemePreference.AUTO and 
-                    old_theme != system_theme):
-                    theme_manager.apply_theme_preference()
-                
-                print(f"🎨 Thème système détecté: {system_theme.value}")
-                return {"status": "success", "system_theme": system_theme.value}
-                
-            except Exception as e:
-                print(f"Erreur détection thème système: {e}")
-                return {"status": "error", "message": str(e)}
-        
-        @app.post('/api/theme/system-changed')
-        async def system_theme_changed(request):
-            """Recevoir la notification de changement du thème système"""
-            try:
-                data = await request.json()
-                new_system_theme = Theme.DARK if data.get('theme') == 'dark' else Theme.LIGHT
-                
-                # Mettre à jour via le manager (il gère automatiquement l'application)
-                theme_manager.set_system_theme(new_system_theme)
-                
-                print(f"🔄 Changement thème système: {new_system_theme.value}")
-                return {"status": "success", "new_system_theme": new_system_theme.value}
-                
-            except Exception as e:
-                print(f"Erreur changement thème système: {e}")
-                return {"status": "error", "message": str(e)}
-        
-        @app.post('/api/language/change')
-        async def change_language_api(request):
-            """API pour changer la langue"""
-            try:
-                data = await request.json()
-                language = data.get('language')
-                
-                if i18n.set_language(language):
-                    return {
-                        "status": "success", 
-                        "language": language,
-                        "language_name": i18n.get_language_name(language)
-                    }
-                else:
-                    return {"status": "error", "message": "Langue non supportée"}
-                    
-            except Exception as e:
-                print(f"Erreur changement langue: {e}")
-                return {"status": "error", "message": str(e)}
-        
-        @app.get('/api/language/current')
-        async def get_current_language():
-            """Obtenir la langue actuelle"""
-            return {
-                "language": i18n.get_language(),
-                "language_name": i18n.get_language_name(i18n.get_language()),
-                "supported_languages": i18n.get_supported_languages(),
-                "locale_info": i18n.get_locale_info()
-            }
-    
-    def setup_rtl_support(self):
-        """Ajouter le support RTL pour les langues arabes"""
-        ui.add_head_html("""
-        <style>
+# CSS du support RTL (langues arabes), minifié à l'import et injecté une seule fois dans <head>
+_RTL_CSS = "<style>" + minify_css("""
         /* === SUPPORT RTL === */
         
         /* Direction du texte selon la langue */
@@ -296,15 +128,199 @@ class MindCareApp:
                 order: 1;
             }
         }
-        </style>
-        """)
-        
-        # Ajouter les polices pour l'arabe
-        ui.add_head_html("""
+        """) + "</style>"
+
+# Polices pour l'arabe, ajoutées seulement aux pages RTL: feuille Google Fonts préchargée
+# en parallèle du reste du <head> puis appliquée sans bloquer le rendu (display=swap: texte
+# affiché avec la police de repli)
+_ARABIC_FONTS_URL = "https://fonts.googleapis.com/css2?family=Amiri:wght@400;700&family=Noto+Sans+Arabic:wght@400;500;600;700&display=swap"
+
+_ARABIC_FONTS = f"""
         <link rel="preconnect" href="https://fonts.googleapis.com">
         <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-        <link href="https://fonts.googleapis.com/css2?family=Amiri:wght@400;700&family=Noto+Sans+Arabic:wght@400;500;600;700&display=swap" rel="stylesheet">
-        """)
+        <link rel="preload" as="style" href="{_ARABIC_FONTS_URL}" onload="this.onload=null;this.rel='stylesheet'">
+        <noscript><link rel="stylesheet" href="{_ARABIC_FONTS_URL}"></noscript>
+        """
+
+# <head> propre à chaque langue (script lang/dir, polices arabes si RTL), construit une seule fois
+_LANGUAGE_HEAD_HTML = {}
+
+# Classes du wrapper principal par (thème, direction), construites une seule fois
+_WRAPPER_CLASSES = {
+    (theme.value, direction): f'content-wrapper {theme.value}-theme {direction}'
+    for theme in Theme
+    for direction in ('ltr', 'rtl')
+}
+
+# Thème système reçu des notifications du navigateur (clair par défaut)
+_SYSTEM_THEMES = {"dark": Theme.DARK, "light": Theme.LIGHT}
+
+# Réponse constante de l'API pour une langue refusée
+_UNSUPPORTED_LANGUAGE_RESPONSE = {"status": "error", "message": "Langue non supportée"}
+
+# Corps JSON de /api/language/current par langue, sérialisés à la première demande
+_CURRENT_LANGUAGE_PAYLOADS = {}
+
+# Routes des pages: (chemin, module, classe). Chaque page est importée à la première
+# visite de sa route: le démarrage ne charge pas FAISS/langchain (chatbot) ni la base
+# (articles, rapports)
+_PAGE_ROUTES = (
+    ('/', 'pages.home', 'HomePage'),
+    ('/articles', 'pages.articles', 'ArticlesPage'),
+    ('/reports', 'pages.reports', 'ReportsPage'),
+    ('/about', 'pages.about', 'AboutPage'),
+    ('/contact', 'pages.contact', 'ContactPage'),
+    ('/chatbot', 'pages.chatbot', 'ChatbotPage'),
+)
+
+class MindCareApp:
+    """Application principale MindCare avec détection de thème système et support i18n"""
+    
+    # Attributs fixes: pas de __dict__ par instance
+    __slots__ = ('current_theme', 'navbar', 'footer')
+    
+    def __init__(self):
+        # Créer les dossiers nécessaires
+        create_directories()
+        
+        # Variables d'état
+        self.current_theme = "light"
+        
+        # Initialiser le système i18n
+        self.initialize_i18n()
+        
+        # Initialiser et appliquer le thème (SANS JavaScript pendant l'init).
+        # Le support RTL et les polices arabes partent dans la même injection <head>.
+        theme_manager.apply_theme(extra_head_html=_RTL_CSS)
+        
+        # Récupérer l'état du thème après initialisation
+        self.current_theme = theme_manager.current_theme.value
+        
+        # Initialiser la navbar avec callbacks
+        self.navbar = Navbar("MindCare", self.current_theme)
+        self.navbar.set_theme_toggle_callback(self.toggle_theme)
+        self.navbar.set_mobile_menu_callback(self.show_mobile_menu)
+
+        # Initialiser la footer avec callbacks
+        self.footer = Footer("MindCare", self.current_theme)
+        
+        # Configurer les routes
+        self.setup_routes()
+        
+        # Configurer les routes API pour la détection système et i18n
+        self.setup_api_routes()
+    
+    def initialize_i18n(self):
+        """Initialiser le système d'internationalisation"""
+        try:
+            # Charger la langue de l'utilisateur depuis le storage
+            i18n.load_language()
+            
+            # Afficher les statistiques de traduction pour le debug, sans retarder le démarrage
+            if settings.debug:
+                from core.i18n import print_translation_stats
+                threading.Thread(target=print_translation_stats, daemon=True).start()
+                
+            print(f"🌐 Système i18n initialisé - Langue: {i18n.get_language()}")
+            
+        except Exception as e:
+            print(f"⚠️ Erreur lors de l'initialisation i18n: {e}")
+            # Utiliser la langue par défaut en cas d'erreur
+            i18n.current_language = settings.default_language
+    
+    def setup_routes(self):
+        """Configuration des routes principales"""
+        for path, module_name, class_name in _PAGE_ROUTES:
+            ui.page(path)(partial(self.render_lazy_page, module_name, class_name))
+        
+        # Route pour le changement de langue
+        @ui.page('/lang/{language}')
+        def change_language(language: str):
+            if i18n.set_language(language):
+                # Rediriger vers la page d'accueil après changement
+                ui.navigate.to('/')
+            else:
+                # Langue invalide, retourner à l'accueil
+                ui.navigate.to('/')
+    
+    def setup_api_routes(self):
+        """Configuration des routes API pour la gestion du thème et de la langue"""
+        # Corps de requête lus et réponses sérialisées avec orjson
+        
+        @app.post('/api/theme/system-detected', response_class=ORJSONResponse)
+        async def system_theme_detected(request: Request):
+            """Recevoir la notification de détection du thème système"""
+            try:
+                data = orjson.loads(await request.body())
+                system_theme = _SYSTEM_THEMES.get(data.get('theme'), Theme.LIGHT)
+                
+                # Écriture du storage différée et regroupée par le manager, hors du
+                # chemin de la requête (notification répétée sans changement: ignorée)
+                theme_manager.set_system_theme(system_theme)
+
+                logger.debug("Thème système détecté: %s", system_theme.value)
+                return {"status": "success", "system_theme": system_theme.value}
+                
+            except Exception as e:
+                logger.warning("Erreur détection thème système: %s", e)
+                return {"status": "error", "message": str(e)}
+        
+        @app.post('/api/theme/system-changed', response_class=ORJSONResponse)
+        async def system_theme_changed(request: Request):
+            """Recevoir la notification de changement du thème système"""
+            try:
+                data = orjson.loads(await request.body())
+                new_system_theme = _SYSTEM_THEMES.get(data.get('theme'), Theme.LIGHT)
+                
+                # Mettre à jour via le manager (il gère automatiquement l'application)
+                theme_manager.set_system_theme(new_system_theme)
+                
+                logger.debug("Changement thème système: %s", new_system_theme.value)
+                return {"status": "success", "new_system_theme": new_system_theme.value}
+                
+            except Exception as e:
+                logger.warning("Erreur changement thème système: %s", e)
+                return {"status": "error", "message": str(e)}
+        
+        @app.post('/api/language/change', response_class=ORJSONResponse)
+        async def change_language_api(request: Request):
+            """API pour changer la langue"""
+            try:
+                data = orjson.loads(await request.body())
+                language = data.get('language')
+                
+                if i18n.set_language(language):
+                    return {
+                        "status": "success", 
+                        "language": language,
+                        "language_name": i18n.get_language_name(language)
+                    }
+                else:
+                    return _UNSUPPORTED_LANGUAGE_RESPONSE
+                    
+            except Exception as e:
+                logger.warning("Erreur changement langue: %s", e)
+                return {"status": "error", "message": str(e)}
+        
+        @app.get('/api/language/current')
+        async def get_current_language():
+            """Obtenir la langue actuelle"""
+            # La réponse ne dépend que de la langue: sérialisée une seule fois par langue
+            language = i18n.get_language()
+            payload = _CURRENT_LANGUAGE_PAYLOADS.get(language)
+            if payload is None:
+                payload = _CURRENT_LANGUAGE_PAYLOADS[language] = orjson.dumps({
+                    "language": language,
+                    "language_name": i18n.get_language_name(language),
+                    "supported_languages": i18n.get_supported_languages(),
+                    "locale_info": i18n.get_locale_info()
+                })
+            return Response(content=payload, media_type="application/json")
+    
+    def render_lazy_page(self, module_name: str, class_name: str):
+        """Importer la page à sa première visite puis la rendre"""
+        page_class = getattr(import_module(module_name), class_name)
+        self.render_page(page_class())
     
     def render_page(self, page_instance):
         """Rendre une page avec layout et support RTL"""
@@ -312,15 +328,25 @@ class MindCareApp:
         direction = i18n.get_language_direction()
         language = i18n.get_language()
         
-        # Ajouter les attributs de langue et direction au HTML
-        ui.run_javascript(f"""
-            document.documentElement.setAttribute('lang', '{language}');
-            document.documentElement.setAttribute('dir', '{direction}');
-            document.body.className = document.body.className.replace(/\\b(rtl|ltr)\\b/g, '') + ' {direction}';
-        """)
+        # Attributs de langue et direction posés dans le HTML initial de la page, dès l'analyse
+        # du <head> (pas de script envoyé après le rendu). La classe de direction est portée
+        # par le wrapper ci-dessous, le <body> n'a plus besoin d'être modifié.
+        # Les pages LTR ne chargent pas les polices arabes.
+        language_head_html = _LANGUAGE_HEAD_HTML.get(language)
+        if language_head_html is None:
+            language_head_html = _LANGUAGE_HEAD_HTML[language] = (
+                f'<script>document.documentElement.lang="{language}";'
+                f'document.documentElement.dir="{direction}";</script>'
+                + (_ARABIC_FONTS if direction == 'rtl' else '')
+            )
+        ui.add_head_html(language_head_html)
+        
+        # Thème de l'utilisateur lu dans son storage au rendu, amorcé dans le <head> de la page
+        theme_manager.apply_page_theme()
+        self.current_theme = theme_manager.current_theme.value
 
         # Créer le wrapper principal avec classe de thème et direction
-        classes = f'content-wrapper {self.current_theme}-theme {direction}'
+        classes = _WRAPPER_CLASSES[self.current_theme, direction]
         with ui.element('div').classes(classes):
             # Navbar - utilise le composant séparé
             self.navbar.render()
@@ -337,11 +363,12 @@ class MindCareApp:
         # Utiliser le ThemeManager pour changer le thème
         theme_manager.toggle_theme()
         
-        # Mettre à jour l'état local
-        self.current_theme = theme_manager.current_theme.value
-        
-        # Mettre à jour le thème dans la navbar
-        self.navbar.update_theme(self.current_theme)
+        # Mettre à jour l'état local et la navbar seulement si le thème effectif a changé
+        # (auto → clair forcé garde souvent le même thème: seule la préférence change)
+        new_theme = theme_manager.current_theme.value
+        if new_theme != self.current_theme:
+            self.current_theme = new_theme
+            self.navbar.update_theme(new_theme)
         self.navbar.update_theme_preference(theme_manager.theme_preference.value)
         
         # La notification est déjà gérée par le ThemeManager
@@ -361,12 +388,13 @@ class MindCareApp:
     
     def get_app_info(self) -> dict:
         """Obtenir les informations de l'application"""
+        language = i18n.get_language()
         return {
             "name": settings.app_name,
             "version": settings.app_version,
             "theme": self.get_theme_status_display(),
-            "language": i18n.get_language(),
-            "language_name": i18n.get_language_name(i18n.get_language()),
+            "language": language,
+            "language_name": i18n.get_language_name(language),
             "direction": i18n.get_language_direction(),
             "debug": settings.debug
         }
@@ -375,33 +403,41 @@ class MindCareApp:
         """Démarrer l'application"""
         app_info = self.get_app_info()
         
-        print(f"🚀 Démarrage de {app_info['name']} v{app_info['version']}")
-        print(f"📱 Serveur: http://localhost:{settings.port}")
-        print(f"🎨 Thème: {app_info['theme']}")
-        print(f"🌐 Langue: {app_info['language']} ({app_info['language_name']})")
-        print(f"📝 Direction: {app_info['direction']}")
-        print(f"🐛 Debug: {app_info['debug']}")
-        print("🌱 Couleur principale: Vert")
-        print("=" * 60)
-        
-        # Afficher les statistiques de traduction en mode debug
+        # Bannière de démarrage écrite en une seule fois
+        print("\n".join((
+            f"🚀 Démarrage de {app_info['name']} v{app_info['version']}",
+            f"📱 Serveur: http://localhost:{settings.port}",
+            f"🎨 Thème: {app_info['theme']}",
+            f"🌐 Langue: {app_info['language']} ({app_info['language_name']})",
+            f"📝 Direction: {app_info['direction']}",
+            f"🐛 Debug: {app_info['debug']}",
+            "🌱 Couleur principale: Vert",
+            "=" * 60,
+        )), flush=True)
+        
+        # Afficher la validation des traductions en mode debug, en arrière-plan
+        # pour que le serveur démarre sans attendre le parcours des traductions
         if settings.debug:
             try:
                 from core.i18n import print_translation_validation
-                print_translation_validation()
+                threading.Thread(target=print_translation_validation, daemon=True).start()
             except Exception as e:
                 print(f"⚠️ Erreur validation traductions: {e}")
         
-        # Lancer NiceGUI
+        # Lancer NiceGUI (rechargement auto et ouverture du navigateur en développement uniquement)
         ui.run(
             port=settings.port,
             storage_secret=settings.secret_key,
-            reload=settings.reload,
-            show=True,
+            reload=settings.debug and settings.reload,
+            show=settings.debug,
             title=f"{settings.app_name} - {_('nav.home')}"
         )
 
 # Point d'entrée principal
 if __name__ in {"__main__", "__mp_main__"}:
+    # Niveau global selon settings.log_level; messages de debug de l'application
+    # (logger "mindcare" et ses enfants) affichés seulement en mode debug
+    logging.basicConfig(level=settings.log_level)
+    logger.setLevel(logging.DEBUG if settings.debug else settings.log_level)
     mindcare_app = MindCareApp()
     mindcare_app.run()
\ No newline at end of file
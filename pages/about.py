@@ -1,161 +1,189 @@
+from html import escape
+from types import MappingProxyType
 from nicegui import ui
 from core.i18n import i18n, _
-from core.theme import theme_manager
+from core.theme import card_classes
+
+_CARD_HOVER = card_classes(hover=True)
+
+# Contenu statique de la page, alloué une seule fois à l'import
+_TEAM_MEMBERS = tuple(MappingProxyType(item) for item in (
+    {
+        "name": "Dr. Sarah Ahmed",
+        "role": "Directrice Médicale",
+        "description": "Psychiatre avec 15 ans d'expérience en santé mentale communautaire.",
+        "specialties": ("Psychiatrie", "Anxiété", "Dépression")
+    },
+    {
+        "name": "Dr. Marc Dubois",
+        "role": "Psychologue Clinicien",
+        "description": "Spécialiste en thérapie cognitive comportementale et gestion du stress.",
+        "specialties": ("TCC", "Stress", "Trauma")
+    },
+    {
+        "name": "Fatima El Alami",
+        "role": "Responsable Recherche",
+        "description": "Docteure en psychologie, spécialisée dans la recherche en santé mentale.",
+        "specialties": ("Recherche", "Mindfulness", "Bien-être")
+    }
+))
+
+_VALUES = tuple(MappingProxyType(item) for item in (
+    {
+        "title": "Accessibilité",
+        "description": "Rendre les ressources de santé mentale accessibles à tous",
+        "icon": "accessible"
+    },
+    {
+        "title": "Qualité",
+        "description": "Fournir du contenu de haute qualité basé sur la recherche",
+        "icon": "verified"
+    },
+    {
+        "title": "Empathie",
+        "description": "Approche empathique et bienveillante dans tous nos services",
+        "icon": "favorite"
+    },
+    {
+        "title": "Innovation",
+        "description": "Utiliser la technologie pour améliorer les soins de santé mentale",
+        "icon": "innovation"
+    }
+))
+
+# Équivalents HTML des éléments NiceGUI utilisés par les sections statiques
+_COLUMN = 'nicegui-column'
+_CARD = 'q-card nicegui-card'
+# Classes posées par Quasar sur ui.chip (couleur par défaut: primary)
+_CHIP = 'q-chip row inline no-wrap items-center bg-primary'
+
+def _icon(name: str, classes: str) -> str:
+    """HTML d'une icône Material (équivalent de ui.icon)"""
+    return f'<i class="q-icon notranslate material-icons {classes}">{escape(name)}</i>'
+
+def _label(text: str, classes: str) -> str:
+    """HTML d'un libellé (équivalent de ui.label)"""
+    return f'<div class="{classes}">{escape(text)}</div>'
+
+def _stat_html(value: str, label: str) -> str:
+    """HTML d'une statistique de la section mission"""
+    return (
+        f'<div class="{_COLUMN} text-center">'
+        + _label(value, 'text-3xl font-bold text-primary')
+        + _label(label, 'text-muted text-sm')
+        + '</div>'
+    )
+
+def _value_card_html(value) -> str:
+    """HTML d'une carte de valeur"""
+    return (
+        f'<div class="{_CARD} {_CARD_HOVER} text-center p-8">'
+        + _icon(value["icon"], 'text-6xl mb-6 text-primary')
+        + _label(value["title"], 'text-2xl font-bold mb-4 text-main')
+        + _label(value["description"], 'text-muted leading-relaxed')
+        + '</div>'
+    )
+
+def _team_member_card_html(member) -> str:
+    """HTML d'une carte de membre de l'équipe"""
+    specialties = "".join(
+        f'<div class="{_CHIP} text-xs px-3 py-1 bg-surface text-primary border border-primary">'
+        f'<div class="q-chip__content col row no-wrap items-center q-anchor--skip">{escape(specialty)}</div></div>'
+        for specialty in member["specialties"]
+    )
+    return (
+        f'<div class="{_CARD} {_CARD_HOVER} text-center overflow-hidden">'
+        '<div class="h-64 bg-surface flex items-center justify-center">'
+        + _icon('person', 'text-8xl text-primary')
+        + '</div><div class="q-card__section q-card__section--vert p-6">'
+        + _label(member["name"], 'text-xl font-bold mb-2 text-main')
+        + _label(member["role"], 'font-semibold mb-4 text-primary')
+        + _label(member["description"], 'text-muted mb-4 leading-relaxed text-sm')
+        + _label('Spécialités', 'font-semibold text-main mb-3 text-sm')
+        + f'<div class="row gap-2 justify-center flex-wrap">{specialties}</div>'
+        + '</div></div>'
+    )
+
+# Sections statiques rendues une seule fois à l'import, puis émises en un seul ui.html
+_HEADER_HTML = (
+    '<div class="w-full py-20 px-4 gradient-hero">'
+    f'<div class="{_COLUMN} page-container text-center text-inverse">'
+    + _label('À propos', 'text-5xl font-bold mb-4')
+    + _label('Découvrez notre mission et notre équipe', 'text-xl opacity-90')
+    + '</div></div>'
+)
+
+_MISSION_HTML = (
+    '<div class="w-full py-20 px-4 bg-card">'
+    f'<div class="{_COLUMN} page-container">'
+    # Version responsive : colonne sur mobile, row sur desktop
+    '<div class="flex flex-col lg:flex-row gap-12 items-center">'
+    # Texte - prend toute la largeur sur mobile, moitié sur desktop
+    f'<div class="{_COLUMN} w-full lg:w-1/2 lg:pr-8">'
+    + _label('Notre Mission', 'text-4xl font-bold mb-6 text-main')
+    + _label(
+        'Améliorer l\'accès aux ressources de santé mentale et sensibiliser le public à l\'importance du bien-être psychologique.',
+        'text-lg text-muted leading-relaxed mb-8'
+    )
+    # Statistiques en grid responsive
+    + '<div class="grid grid-cols-2 sm:grid-cols-3 gap-6 mt-8">'
+    + _stat_html('150+', 'Articles')
+    + _stat_html('25+', 'Rapports')
+    + _stat_html('1200+', 'Utilisateurs')
+    + '</div></div>'
+    # Image/Illustration - prend toute la largeur sur mobile, moitié sur desktop
+    + f'<div class="{_COLUMN} w-full lg:w-1/2">'
+    '<div class="h-80 bg-surface rounded-2xl flex items-center justify-center shadow-lg">'
+    f'<div class="{_COLUMN} text-center">'
+    + _icon('psychology', 'text-8xl mb-4 text-primary')
+    + _label('Santé Mentale', 'text-2xl font-bold text-main')
+    + _label('Notre expertise à votre service', 'text-muted')
+    + '</div></div></div>'
+    '</div></div></div>'
+)
+
+_VALUES_HTML = (
+    '<div class="w-full py-20 px-4 bg-surface">'
+    f'<div class="{_COLUMN} page-container">'
+    + _label('Nos Valeurs', 'text-4xl font-bold text-center mb-16 text-main')
+    # Grid responsive pour les valeurs
+    + '<div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-8">'
+    + "".join(_value_card_html(value) for value in _VALUES)
+    + '</div></div></div>'
+)
+
+_TEAM_HTML = (
+    '<div class="w-full py-20 px-4 bg-card">'
+    f'<div class="{_COLUMN} page-container">'
+    + _label('Notre Équipe', 'text-4xl font-bold text-center mb-6 text-main')
+    + _label('Une équipe de professionnels dévoués à votre bien-être', 'text-lg text-center text-muted mb-16')
+    # Grid responsive pour l'équipe
+    + '<div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">'
+    + "".join(_team_member_card_html(member) for member in _TEAM_MEMBERS)
+    + '</div></div></div>'
+)
+
+# En-tête, mission, valeurs et équipe se suivent: un seul élément pour les quatre
+_STATIC_SECTIONS_HTML = _HEADER_HTML + _MISSION_HTML + _VALUES_HTML + _TEAM_HTML
 
 class AboutPage:
     """Page à propos avec système de thème centralisé"""
     
-    def __init__(self):
-        self.team_members = [
-            {
-                "name": "Dr. Sarah Ahmed",
-                "role": "Directrice Médicale",
-                "description": "Psychiatre avec 15 ans d'expérience en santé mentale communautaire.",
-                "specialties": ["Psychiatrie", "Anxiété", "Dépression"]
-            },
-            {
-                "name": "Dr. Marc Dubois", 
-                "role": "Psychologue Clinicien",
-                "description": "Spécialiste en thérapie cognitive comportementale et gestion du stress.",
-                "specialties": ["TCC", "Stress", "Trauma"]
-            },
-            {
-                "name": "Fatima El Alami",
-                "role": "Responsable Recherche", 
-                "description": "Docteure en psychologie, spécialisée dans la recherche en santé mentale.",
-                "specialties": ["Recherche", "Mindfulness", "Bien-être"]
-            }
-        ]
-        
-        self.values = [
-            {
-                "title": "Accessibilité",
-                "description": "Rendre les ressources de santé mentale accessibles à tous",
-                "icon": "accessible"
-            },
-            {
-                "title": "Qualité",
-                "description": "Fournir du contenu de haute qualité basé sur la recherche",
-                "icon": "verified"
-            },
-            {
-                "title": "Empathie",
-                "description": "Approche empathique et bienveillante dans tous nos services",
-                "icon": "favorite"
-            },
-            {
-                "title": "Innovation",
-                "description": "Utiliser la technologie pour améliorer les soins de santé mentale",
-                "icon": "innovation"
-            }
-        ]
+    # Contenu statique partagé par toutes les instances
+    team_members = _TEAM_MEMBERS
+    values = _VALUES
     
     def render(self):
         """Rendre la page à propos"""
-        # Header
-        self.render_header()
-        
-        # Mission
-        self.render_mission_section()
-        
-        # Values
-        self.render_values_section()
-        
-        # Team
-        self.render_team_section()
+        # Header, mission, valeurs et équipe (HTML précalculé)
+        self.render_static_sections()
         
         # CTA
         self.render_cta_section()
     
-    def render_header(self):
-        """Rendre l'en-tête avec gradient de thème"""
-        with ui.element('div').classes('w-full py-20 px-4 gradient-hero'):
-            with ui.column().classes('page-container text-center text-inverse'):
-                ui.label('À propos').classes('text-5xl font-bold mb-4')
-                ui.label('Découvrez notre mission et notre équipe').classes('text-xl opacity-90')
-    
-    def render_mission_section(self):
-        """Rendre la section mission avec classes de thème"""
-        with ui.element('div').classes('w-full py-20 px-4 bg-card'):
-            with ui.column().classes('page-container'):
-                
-                # Version responsive : colonne sur mobile, row sur desktop
-                with ui.element('div').classes('flex flex-col lg:flex-row gap-12 items-center'):
-                    
-                    # Texte - prend toute la largeur sur mobile, moitié sur desktop
-                    with ui.column().classes('w-full lg:w-1/2 lg:pr-8'):
-                        ui.label('Notre Mission').classes('text-4xl font-bold mb-6 text-main')
-                        ui.label('Améliorer l\'accès aux ressources de santé mentale et sensibiliser le public à l\'importance du bien-être psychologique.').classes('text-lg text-muted leading-relaxed mb-8')
-                        
-                        # Statistiques en grid responsive
-                        with ui.element('div').classes('grid grid-cols-2 sm:grid-cols-3 gap-6 mt-8'):
-                            with ui.column().classes('text-center'):
-                                ui.label('150+').classes('text-3xl font-bold text-primary')
-                                ui.label('Articles').classes('text-muted text-sm')
-                            
-                            with ui.column().classes('text-center'):
-                                ui.label('25+').classes('text-3xl font-bold text-primary')
-                                ui.label('Rapports').classes('text-muted text-sm')
-                            
-                            with ui.column().classes('text-center'):
-                                ui.label('1200+').classes('text-3xl font-bold text-primary')
-                                ui.label('Utilisateurs').classes('text-muted text-sm')
-                    
-                    # Image/Illustration - prend toute la largeur sur mobile, moitié sur desktop
-                    with ui.column().classes('w-full lg:w-1/2'):
-                        with ui.element('div').classes('h-80 bg-surface rounded-2xl flex items-center justify-center shadow-lg'):
-                            with ui.column().classes('text-center'):
-                                ui.icon('psychology').classes('text-8xl mb-4 text-primary')
-                                ui.label('Santé Mentale').classes('text-2xl font-bold text-main')
-                                ui.label('Notre expertise à votre service').classes('text-muted')
-    
-    def render_values_section(self):
-        """Rendre la section valeurs avec classes de thème"""
-        with ui.element('div').classes('w-full py-20 px-4 bg-surface'):
-            with ui.column().classes('page-container'):
-                ui.label('Nos Valeurs').classes('text-4xl font-bold text-center mb-16 text-main')
-                
-                # Grid responsive pour les valeurs
-                with ui.element('div').classes('grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-8'):
-                    for value in self.values:
-                        self.render_value_card(value)
-    
-    def render_value_card(self, value):
-        """Rendre une carte de valeur avec classes de thème"""
-        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' text-center p-8'):
-            ui.icon(value["icon"]).classes('text-6xl mb-6 text-primary')
-            ui.label(value["title"]).classes('text-2xl font-bold mb-4 text-main')
-            ui.label(value["description"]).classes('text-muted leading-relaxed')
-    
-    def render_team_section(self):
-        """Rendre la section équipe avec classes de thème"""
-        with ui.element('div').classes('w-full py-20 px-4 bg-card'):
-            with ui.column().classes('page-container'):
-                ui.label('Notre Équipe').classes('text-4xl font-bold text-center mb-6 text-main')
-                ui.label('Une équipe de professionnels dévoués à votre bien-être').classes('text-lg text-center text-muted mb-16')
-                
-                # Grid responsive pour l'équipe
-                with ui.element('div').classes('grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8'):
-                    for member in self.team_members:
-                        self.render_team_member_card(member)
-    
-    def render_team_member_card(self, member):
-        """Rendre une carte de membre de l'équipe avec classes de thème"""
-        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' text-center overflow-hidden'):
-            # Image placeholder avec gradient
-            with ui.element('div').classes('h-64 bg-surface flex items-center justify-center'):
-                ui.icon('person').classes('text-8xl text-primary')
-            
-            with ui.card_section().classes('p-6'):
-                ui.label(member["name"]).classes('text-xl font-bold mb-2 text-main')
-                ui.label(member["role"]).classes('font-semibold mb-4 text-primary')
-                ui.label(member["description"]).classes('text-muted mb-4 leading-relaxed text-sm')
-                
-                # Spécialités avec style amélioré
-                ui.label('Spécialités').classes('font-semibold text-main mb-3 text-sm')
-                with ui.row().classes('gap-2 justify-center flex-wrap'):
-                    for specialty in member["specialties"]:
-                        ui.chip(specialty).classes('text-xs px-3 py-1 bg-surface text-primary border border-primary')
+    def render_static_sections(self):
+        """Rendre les sections statiques en un seul élément"""
+        ui.html(_STATIC_SECTIONS_HTML).classes('w-full')
     
     def render_cta_section(self):
         """Rendre la section call-to-action avec gradient de thème"""
@@ -177,40 +205,3 @@ class AboutPage:
                         on_click=lambda: ui.navigate.to('/articles'),
                         icon='article'
                     ).classes('border-2 border-white text-white px-8 py-4 rounded-lg font-semibold hover:bg-white hover:text-primary transition-all w-full sm:w-auto')
-    
-    def render_additional_info_section(self):
-        """Section additionnelle avec plus d'informations avec classes de thème"""
-        with ui.element('div').classes('w-full py-16 px-4 bg-surface'):
-            with ui.column().classes('page-container'):
-                ui.label('Pourquoi MindCare ?').classes('text-3xl font-bold text-center mb-12 text-main')
-                
-                # Avantages en grid
-                advantages = [
-                    {
-                        "icon": "verified_user",
-                        "title": "Expertise Reconnue",
-                        "description": "Une équipe de professionnels certifiés avec des années d'expérience"
-                    },
-                    {
-                        "icon": "schedule",
-                        "title": "Disponibilité 24/7",
-                        "description": "Des ressources accessibles à tout moment pour votre bien-être"
-                    },
-                    {
-                        "icon": "security",
-                        "title": "Confidentialité Garantie",
-                        "description": "Vos données et votre vie privée sont notre priorité absolue"
-                    },
-                    {
-                        "icon": "trending_up",
-                        "title": "Approche Moderne",
-                        "description": "Méthodes thérapeutiques basées sur les dernières recherches"
-                    }
-                ]
-                
-                with ui.element('div').classes('grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6'):
-                    for advantage in advantages:
-                        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' text-center p-6'):
-                            ui.icon(advantage["icon"]).classes('text-5xl mb-4 text-primary')
-                            ui.label(advantage["title"]).classes('text-lg font-bold mb-3 text-main')
-                            ui.label(advantage["description"]).classes('text-muted text-sm leading-relaxed')
\ No newline at end of file
@@ -1,8 +1,143 @@
-from nicegui import ui
+from nicegui import ui, app
 from core.i18n import i18n, _
-from core.theme import theme_manager
-from config.database import SessionLocal, ArticleService
-import json
+from core.theme import button_classes, card_classes
+from config.database import ScopedSession, Article
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from sqlalchemy import case, func, select, update
+import asyncio
+import orjson
+from html import escape
+import hashlib
+
+_BUTTON_PRIMARY_MD = button_classes('primary', 'md')
+_BUTTON_PRIMARY_SM = button_classes('primary', 'sm')
+_CARD_HOVER = card_classes(hover=True)
+
+# Badges des cartes d'article
+_CHIP = 'inline-flex items-center rounded-full px-3 py-1 text-xs'
+_DIFFICULTY_CLASSES = {
+    "beginner": "bg-green-500 text-white",
+    "intermediate": "bg-yellow-500 text-white",
+    "advanced": "bg-red-500 text-white"
+}
+
+# Vues d'articles en attente d'écriture: cumulées en mémoire puis écrites
+# en une seule requête UPDATE _VIEWS_FLUSH_INTERVAL secondes après la première
+_VIEWS_FLUSH_INTERVAL = 5.0
+_pending_views = Counter()
+
+@contextmanager
+def _session():
+    """Session de la base de données du thread courant, réutilisée d'un appel à l'autre"""
+    db = ScopedSession()
+    try:
+        yield db
+    finally:
+        # Fin de l'unité de travail: transaction terminée (annulée si non validée) et connexion
+        # rendue au pool; la session du thread reste dans le registre pour l'appel suivant
+        db.close()
+
+# Colonnes des listes d'articles, valeurs par défaut appliquées directement par la base
+_ARTICLE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.summary,
+    Article.category,
+    Article.author,
+    Article.date_created,
+    Article.date_updated,
+    func.coalesce(Article.read_time, 5).label("read_time"),
+    Article.image,
+    Article.tags,
+    func.coalesce(Article.views, 0).label("views"),
+    func.coalesce(Article.likes, 0).label("likes"),
+    func.coalesce(Article.shares, 0).label("shares"),
+    func.coalesce(Article.featured, False).label("featured"),
+    func.coalesce(Article.published, True).label("published"),
+    func.coalesce(Article.difficulty, "beginner").label("difficulty"),
+)
+
+@lru_cache(maxsize=512)
+def _parse_tags(raw_tags: str) -> tuple:
+    """Décoder une liste de tags JSON (mise en cache: les mêmes chaînes reviennent souvent)"""
+    return tuple(orjson.loads(raw_tags))
+
+def _fetch_articles(stmt) -> list:
+    """Exécuter une projection d'articles et renvoyer des dictionnaires prêts à afficher"""
+    with _session() as db:
+        rows = db.execute(stmt).mappings().all()
+    
+    articles = []
+    for row in rows:
+        article = dict(row)
+        date_created = article.pop("date_created")
+        date_updated = article.pop("date_updated")
+        article["date"] = date_created.strftime("%Y-%m-%d") if date_created else ""
+        article["updated_at"] = date_updated.isoformat() if date_updated else ""
+        article["tags"] = _parse_tags(article["tags"]) if article["tags"] else ()
+        articles.append(article)
+    return articles
+
+def _flush_views():
+    """Écrire les vues en attente en une seule requête atomique"""
+    if not _pending_views:
+        return
+    
+    counts = dict(_pending_views)
+    _pending_views.clear()
+    try:
+        with _session() as db:
+            db.execute(
+                update(Article)
+                .where(Article.id.in_(counts))
+                .values(views=func.coalesce(Article.views, 0) + case(counts, value=Article.id, else_=0))
+            )
+            db.commit()
+    except Exception as e:
+        # Écriture échouée: les vues sont remises en attente et réessayées à la fenêtre suivante
+        _pending_views.update(counts)
+        print(f"❌ Erreur lors de l'incrémentation des vues: {e}")
+        try:
+            asyncio.get_running_loop().call_later(_VIEWS_FLUSH_INTERVAL, _flush_views)
+        except RuntimeError:
+            # Hors de la boucle d'événements: réessayées à la prochaine vue ou à l'arrêt
+            pass
+
+def _record_view(article_id: int):
+    """Compter une vue, écrite avec les autres à la fin de la fenêtre"""
+    first_view = not _pending_views
+    _pending_views[article_id] += 1
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Hors de la boucle d'événements (scripts): écriture immédiate
+        _flush_views()
+        return
+    
+    if first_view:
+        # Première vue de la fenêtre: programmer l'écriture groupée
+        loop.call_later(_VIEWS_FLUSH_INTERVAL, _flush_views)
+
+# Vues restantes écrites à l'arrêt du serveur, puis session du thread libérée
+app.on_shutdown(_flush_views)
+app.on_shutdown(ScopedSession.remove)
+
+# HTML statique des cartes d'article, indexé par empreinte du contenu affiché.
+# Une seule entrée par article: la clé périmée d'un article modifié est évincée,
+# le cache reste borné par le nombre d'articles
+_CARD_HTML_CACHE = {}
+_CARD_KEY_BY_ID = {}
+
+# Champs rendus dans le HTML statique d'une carte (les compteurs restent dynamiques)
+_CARD_HASHED_FIELDS = ("id", "title", "summary", "category", "author", "date",
+                       "read_time", "image", "featured", "difficulty", "tags")
+
+def _card_cache_key(article) -> bytes:
+    """Empreinte BLAKE2b des champs affichés: une carte modifiée change de clé"""
+    content = "\x1f".join(str(article.get(field, "")) for field in _CARD_HASHED_FIELDS)
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
 class ArticlesPage:
     """Page des articles utilisant la base de données"""
@@ -11,6 +146,10 @@ class ArticlesPage:
         self.articles = []
         self.current_category = "all"
         
+        # Index en mémoire construits au chargement: catégorie -> articles, articles en vedette
+        self._by_category = {}
+        self._featured = []
+        
         self.categories = {
             "all": "Tous",
             "anxiety": "Anxiété",
@@ -27,77 +166,35 @@ class ArticlesPage:
     def load_articles_from_db(self):
         """Charger les articles depuis la base de données"""
         try:
-            db = SessionLocal()
-            # Utiliser le service pour récupérer tous les articles
-            db_articles = ArticleService.get_all(db)
-            
-            # Convertir les objets SQLAlchemy en dictionnaires
-            self.articles = []
-            for article in db_articles:
-                article_dict = {
-                    "id": article.id,
-                    "title": article.title,
-                    "summary": article.summary,
-                    "category": article.category,
-                    "author": article.author,
-                    "date": article.date_created.strftime("%Y-%m-%d") if article.date_created else "",
-                    "read_time": article.read_time or 5,
-                    "image": article.image,
-                    "tags": json.loads(article.tags) if article.tags else [],
-                    "views": article.views or 0,
-                    "likes": article.likes or 0,
-                    "shares": article.shares or 0,
-                    "featured": article.featured or False,
-                    "published": article.published or True,
-                    "difficulty": article.difficulty or "beginner",
-                    "content": article.content or ""
-                }
-                self.articles.append(article_dict)
-            
-            db.close()
+            # Mêmes filtres que ArticleService.get_all
+            self.articles = _fetch_articles(
+                select(*_ARTICLE_COLUMNS, func.coalesce(Article.content, "").label("content"))
+                .where(Article.published == True)
+                .limit(100)
+            )
             print(f"✅ {len(self.articles)} articles chargés depuis la base de données")
             
         except Exception as e:
             print(f"❌ Erreur lors du chargement des articles: {e}")
             # En cas d'erreur, utiliser une liste vide
             self.articles = []
+        
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """Regrouper les articles chargés par catégorie et extraire ceux en vedette"""
+        by_category = defaultdict(list)
+        for article in self.articles:
+            by_category[article["category"]].append(article)
+        
+        self._by_category = dict(by_category)
+        self._featured = [article for article in self.articles if article["featured"]]
     
     def get_articles_by_category(self, category: str):
-        """Obtenir les articles d'une catégorie spécifique depuis la BDD"""
+        """Obtenir les articles d'une catégorie spécifique (index en mémoire)"""
         if category == "all":
             return self.articles
-        
-        try:
-            db = SessionLocal()
-            db_articles = ArticleService.get_by_category(db, category)
-            
-            filtered_articles = []
-            for article in db_articles:
-                article_dict = {
-                    "id": article.id,
-                    "title": article.title,
-                    "summary": article.summary,
-                    "category": article.category,
-                    "author": article.author,
-                    "date": article.date_created.strftime("%Y-%m-%d") if article.date_created else "",
-                    "read_time": article.read_time or 5,
-                    "image": article.image,
-                    "tags": json.loads(article.tags) if article.tags else [],
-                    "views": article.views or 0,
-                    "likes": article.likes or 0,
-                    "shares": article.shares or 0,
-                    "featured": article.featured or False,
-                    "published": article.published or True,
-                    "difficulty": article.difficulty or "beginner"
-                }
-                filtered_articles.append(article_dict)
-            
-            db.close()
-            return filtered_articles
-            
-        except Exception as e:
-            print(f"❌ Erreur lors du filtrage par catégorie: {e}")
-            return []
+        return self._by_category.get(category, [])
     
     def search_articles(self, query: str):
         """Rechercher des articles dans la base de données"""
@@ -105,70 +202,21 @@ class ArticlesPage:
             return self.articles
         
         try:
-            db = SessionLocal()
-            db_articles = ArticleService.search(db, query)
-            
-            search_results = []
-            for article in db_articles:
-                article_dict = {
-                    "id": article.id,
-                    "title": article.title,
-                    "summary": article.summary,
-                    "category": article.category,
-                    "author": article.author,
-                    "date": article.date_created.strftime("%Y-%m-%d") if article.date_created else "",
-                    "read_time": article.read_time or 5,
-                    "image": article.image,
-                    "tags": json.loads(article.tags) if article.tags else [],
-                    "views": article.views or 0,
-                    "likes": article.likes or 0,
-                    "shares": article.shares or 0,
-                    "featured": article.featured or False,
-                    "published": article.published or True,
-                    "difficulty": article.difficulty or "beginner"
-                }
-                search_results.append(article_dict)
-            
-            db.close()
-            return search_results
+            return _fetch_articles(
+                select(*_ARTICLE_COLUMNS).where(
+                    Article.title.contains(query) |
+                    Article.summary.contains(query) |
+                    Article.content.contains(query)
+                )
+            )
             
         except Exception as e:
             print(f"❌ Erreur lors de la recherche: {e}")
             return []
     
     def get_featured_articles(self):
-        """Obtenir les articles en vedette"""
-        try:
-            db = SessionLocal()
-            db_articles = ArticleService.get_featured(db)
-            
-            featured_articles = []
-            for article in db_articles:
-                article_dict = {
-                    "id": article.id,
-                    "title": article.title,
-                    "summary": article.summary,
-                    "category": article.category,
-                    "author": article.author,
-                    "date": article.date_created.strftime("%Y-%m-%d") if article.date_created else "",
-                    "read_time": article.read_time or 5,
-                    "image": article.image,
-                    "tags": json.loads(article.tags) if article.tags else [],
-                    "views": article.views or 0,
-                    "likes": article.likes or 0,
-                    "shares": article.shares or 0,
-                    "featured": article.featured or False,
-                    "published": article.published or True,
-                    "difficulty": article.difficulty or "beginner"
-                }
-                featured_articles.append(article_dict)
-            
-            db.close()
-            return featured_articles
-            
-        except Exception as e:
-            print(f"❌ Erreur lors du chargement des articles en vedette: {e}")
-            return []
+        """Obtenir les articles en vedette (index en mémoire)"""
+        return self._featured
     
     def render(self):
         """Rendre la page des articles"""
@@ -188,6 +236,7 @@ class ArticlesPage:
                 ui.label('Articles').classes('text-5xl font-bold mb-4')
                 ui.label('Découvrez nos articles sur la santé mentale').classes('text-xl opacity-90')
     
+    @ui.refreshable
     def render_filters(self):
         """Rendre les filtres avec classes de thème"""
         with ui.element('div').classes('w-full py-6 px-4 bg-card border-default border-b'):
@@ -201,13 +250,14 @@ class ArticlesPage:
                             ui.button(
                                 label,
                                 on_click=lambda k=key: self.filter_by_category(k)
-                            ).classes(theme_manager.get_button_classes('primary', 'sm'))
+                            ).classes(_BUTTON_PRIMARY_SM)
                         else:
                             ui.button(
                                 label,
                                 on_click=lambda k=key: self.filter_by_category(k)
                             ).classes('px-4 py-2 rounded bg-surface text-muted hover:bg-hover hover:text-primary transition-colors')
     
+    @ui.refreshable
     def render_articles_grid(self):
         """Rendre la grille des articles avec classes de thème"""
         filtered_articles = self.get_filtered_articles()
@@ -232,63 +282,32 @@ class ArticlesPage:
             ui.button(
                 'Voir tous les articles',
                 on_click=lambda: self.filter_by_category('all')
-            ).classes(theme_manager.get_button_classes('primary', 'md'))
+            ).classes(_BUTTON_PRIMARY_MD)
     
     def render_article_card(self, article):
         """Rendre une carte d'article avec classes de thème"""
-        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' cursor-pointer'):
-            # Image placeholder ou réelle
-            with ui.element('div').classes('h-48 bg-surface flex items-center justify-center relative overflow-hidden'):
-                if article.get("image"):
-                    ui.image(article["image"]).classes('w-full h-full object-cover')
-                else:
-                    ui.icon('article').classes('text-4xl text-muted')
-                
-                # Badge featured
-                if article.get("featured"):
-                    with ui.element('div').classes('absolute top-2 right-2'):
-                        ui.chip('⭐ En vedette').classes('bg-yellow-500 text-white text-xs')
-                
-                # Badge difficulté
-                if article.get("difficulty"):
-                    with ui.element('div').classes('absolute top-2 left-2'):
-                        difficulty_colors = {
-                            "beginner": "bg-green-500 text-white",
-                            "intermediate": "bg-yellow-500 text-white", 
-                            "advanced": "bg-red-500 text-white"
-                        }
-                        color_class = difficulty_colors.get(article["difficulty"], "bg-gray-500 text-white")
-                        ui.chip(article["difficulty"].title()).classes(f'{color_class} text-xs')
+        # Partie statique de la carte (image, badges, textes, tags) construite une seule fois
+        # par contenu d'article; seule la ligne d'actions reste en éléments NiceGUI
+        cache_key = _card_cache_key(article)
+        card_html = _CARD_HTML_CACHE.get(cache_key)
+        if card_html is None:
+            stale_key = _CARD_KEY_BY_ID.get(article["id"])
+            if stale_key is not None:
+                _CARD_HTML_CACHE.pop(stale_key, None)
+            _CARD_KEY_BY_ID[article["id"]] = cache_key
+            card_html = _CARD_HTML_CACHE[cache_key] = self._build_card_html(article)
+        
+        with ui.card().classes(_CARD_HOVER + ' cursor-pointer'):
+            ui.html(card_html).classes('w-full')
             
-            with ui.card_section().classes('p-6'):
-                # Catégorie avec couleur de thème
-                category_name = self.categories.get(article["category"], article["category"])
-                ui.chip(category_name).classes(theme_manager.get_button_classes('primary', 'sm') + ' text-xs mb-3')
-                
-                # Titre
-                ui.label(article["title"]).classes('text-xl font-bold mb-2 line-clamp-2 text-main')
-                
-                # Résumé
-                ui.label(article["summary"]).classes('text-muted mb-4 line-clamp-3')
-                
-                # Métadonnées
-                with ui.row().classes('items-center gap-4 text-sm text-muted mb-4'):
-                    ui.label(f"👤 {article['author']}")
-                    ui.label(f"📅 {article['date']}")
-                    ui.label(f"⏱️ {article['read_time']} min")
-                
-                # Tags
-                with ui.row().classes('gap-1 mb-4 flex-wrap'):
-                    for tag in article["tags"][:3]:
-                        ui.chip(f"#{tag}").classes('text-xs bg-surface text-muted')
-                
+            with ui.card_section().classes('px-6 pb-6 pt-0'):
                 # Actions avec bouton de thème
                 with ui.row().classes('justify-between items-center'):
                     ui.button(
                         'Lire plus',
                         on_click=lambda a=article: self.read_article(a),
                         icon='read_more'
-                    ).classes(theme_manager.get_button_classes('primary', 'md'))
+                    ).classes(_BUTTON_PRIMARY_MD)
                     
                     with ui.row().classes('gap-2 items-center text-sm text-muted'):
                         ui.label(f"👁 {article['views']}")
@@ -296,49 +315,75 @@ class ArticlesPage:
                         if article.get('shares', 0) > 0:
                             ui.label(f"📤 {article['shares']}")
     
-    def get_filtered_articles(self):
-        """Obtenir les articles filtrés"""
-        if self.current_category == "all":
-            return self.articles
+    def _build_card_html(self, article) -> str:
+        """Construire le HTML statique d'une carte d'article"""
+        parts = ['<div class="h-48 bg-surface flex items-center justify-center relative overflow-hidden">']
+        
+        # Image placeholder ou réelle
+        if article.get("image"):
+            parts.append(f'<img src="{escape(article["image"])}" class="w-full h-full object-cover">')
         else:
-            return self.get_articles_by_category(self.current_category)
+            parts.append('<i class="q-icon notranslate material-icons text-4xl text-muted">article</i>')
+        
+        # Badge featured
+        if article.get("featured"):
+            parts.append(f'<div class="absolute top-2 right-2"><span class="{_CHIP} bg-yellow-500 text-white">⭐ En vedette</span></div>')
+        
+        # Badge difficulté
+        if article.get("difficulty"):
+            color_class = _DIFFICULTY_CLASSES.get(article["difficulty"], "bg-gray-500 text-white")
+            parts.append(
+                f'<div class="absolute top-2 left-2">'
+                f'<span class="{_CHIP} {color_class}">{escape(article["difficulty"].title())}</span></div>'
+            )
+        
+        parts.append('</div><div class="q-card__section q-card__section--vert p-6">')
+        
+        # Catégorie avec couleur de thème
+        category_name = self.categories.get(article["category"], article["category"])
+        parts.append(f'<span class="inline-flex {_BUTTON_PRIMARY_SM} text-xs mb-3">{escape(category_name)}</span>')
+        
+        # Titre et résumé
+        parts.append(f'<div class="text-xl font-bold mb-2 line-clamp-2 text-main">{escape(article["title"])}</div>')
+        parts.append(f'<div class="text-muted mb-4 line-clamp-3">{escape(article["summary"] or "")}</div>')
+        
+        # Métadonnées
+        parts.append(
+            f'<div class="row items-center gap-4 text-sm text-muted mb-4">'
+            f'<div>👤 {escape(article["author"])}</div>'
+            f'<div>📅 {escape(article["date"])}</div>'
+            f'<div>⏱️ {article["read_time"]} min</div></div>'
+        )
+        
+        # Tags
+        parts.append('<div class="row gap-1 mb-4 flex-wrap">')
+        for tag in article["tags"][:3]:
+            parts.append(f'<span class="{_CHIP} bg-surface text-muted">#{escape(str(tag))}</span>')
+        parts.append('</div></div>')
+        
+        return "".join(parts)
+    
+    def get_filtered_articles(self):
+        """Obtenir les articles filtrés (en mémoire, sans nouvelle requête)"""
+        return self.get_articles_by_category(self.current_category)
     
     def filter_by_category(self, category):
         """Filtrer par catégorie"""
         self.current_category = category
-        # Recharger la page avec la nouvelle catégorie
         ui.notify(f'Filtrage par catégorie: {self.categories[category]}', type='info')
         
-        # Dans une vraie app avec état, on mettrait à jour l'affichage ici
-        # Pour l'instant, on simule avec une notification
-        ui.run_javascript('window.location.reload()')
+        # Mettre à jour seulement les filtres et la grille, sans recharger la page
+        self.render_filters.refresh()
+        self.render_articles_grid.refresh()
     
     def read_article(self, article):
         """Lire un article"""
-        # Incrémenter le nombre de vues dans la base de données
-        try:
-            db = SessionLocal()
-            db_article = db.query(ArticleService.Article).filter_by(id=article["id"]).first()
-            if db_article:
-                db_article.views = (db_article.views or 0) + 1
-                db.commit()
-            db.close()
-        except Exception as e:
-            print(f"❌ Erreur lors de l'incrémentation des vues: {e}")
+        # Incrémenter le nombre de vues dans la base de données (écriture groupée)
+        _record_view(article["id"])
         
         ui.notify(f'Ouverture de l\'article: {article["title"]}', type='info')
         # Dans une vraie app: ui.navigate.to(f'/article/{article["id"]}')
         
     def increment_article_views(self, article_id: int):
         """Incrémenter le nombre de vues d'un article"""
-        try:
-            db = SessionLocal()
-            from config.database import Article
-            article = db.query(Article).filter_by(id=article_id).first()
-            if article:
-                article.views = (article.views or 0) + 1
-                db.commit()
-                print(f"✅ Vues incrémentées pour l'article {article_id}")
-            db.close()
-        except Exception as e:
-            print(f"❌ Erreur lors de l'incrémentation des vues: {e}")
\ No newline at end of file
+        _record_view(article_id)
\ No newline at end of file
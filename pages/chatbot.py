@@ -4,13 +4,17 @@ import asyncio
 from nicegui import ui
 from dotenv import load_dotenv
 import os
-from core.theme import theme_manager
+from core.theme import button_classes, card_classes
 
 from chatbot.vector import VectorDB
 from chatbot.chatbot_memory import ChatbotMemory
 
 load_dotenv()
 
+_BUTTON_PRIMARY_LG = button_classes('primary', 'lg')
+_CARD_ELEVATED = card_classes(elevated=True)
+_CARD_HOVER = card_classes(hover=True)
+
 class ChatbotPage:
     """Page du chatbot interactif MindCare avec système de thème centralisé"""
 
@@ -82,7 +86,7 @@ class ChatbotPage:
             with ui.column().classes('w-full max-w-7xl mx-auto'):
                 
                 # Container principal du chat avec glassmorphism et thème
-                with ui.card().classes(theme_manager.get_card_classes(elevated=True) + ' rounded-3xl p-6 shadow-2xl bg-card'):
+                with ui.card().classes(_CARD_ELEVATED + ' rounded-3xl p-6 shadow-2xl bg-card'):
                     
                     # En-tête du chat
                     with ui.row().classes('w-full items-center justify-between mb-6 pb-4 border-default border-b border-opacity-20'):
@@ -102,7 +106,7 @@ class ChatbotPage:
                     with self.chat_messages:
                         with ui.row().classes('w-full justify-start mb-4'):
                             # Messages plus larges sur grands écrans
-                            with ui.card().classes(theme_manager.get_card_classes() + ' rounded-2xl px-4 py-3 max-w-md xl:max-w-3xl'):
+                            with ui.card().classes(_CARD_HOVER + ' rounded-2xl px-4 py-3 max-w-md xl:max-w-3xl'):
                                 with ui.row().classes('items-start gap-3'):
                                     ui.avatar('https://via.placeholder.com/32x32/10b981/ffffff?text=AI', size='sm')
                                     with ui.column().classes('gap-2'):
@@ -123,7 +127,7 @@ class ChatbotPage:
                         ui.button(
                             icon='send', 
                             on_click=self.send_message
-                        ).classes(theme_manager.get_button_classes('primary', 'lg') + ' send-button px-6 py-3 rounded-xl font-semibold') \
+                        ).classes(_BUTTON_PRIMARY_LG + ' send-button px-6 py-3 rounded-xl font-semibold') \
                         .props('no-caps')
 
                 # Suggestions rapides
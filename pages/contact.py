@@ -1,10 +1,15 @@
 from nicegui import ui
 from core.i18n import i18n, _
-from core.theme import theme_manager
+from core.theme import button_classes, card_classes
 from utils.validators import MindCareValidators
 from utils.translation_helpers import MultilingualForm, with_language_support
 from typing import Optional
 
+_BUTTON_OUTLINE_SM = button_classes('outline', 'sm')
+_BUTTON_PRIMARY_LG = button_classes('primary', 'lg')
+_CARD_ELEVATED = card_classes(elevated=True)
+_CARD_HOVER = card_classes(hover=True)
+
 class ContactPage:
     """Page de contact avec système de thème centralisé et traductions complètes"""
     
@@ -83,7 +88,7 @@ class ContactPage:
         """Rendre le formulaire de contact avec classes de thème et traductions"""
         ui.label(_('contact.form.title')).classes('text-3xl font-bold mb-6 text-main')
         
-        with ui.card().classes(theme_manager.get_card_classes(elevated=True) + ' p-8'):
+        with ui.card().classes(_CARD_ELEVATED + ' p-8'):
             with ui.column().classes('gap-4'):
                 # Champs du formulaire avec traductions
                 name_input = ui.input(_('contact.form.name')).classes('w-full').props('outlined')
@@ -126,7 +131,7 @@ class ContactPage:
                         privacy_checkbox.value
                     ),
                     icon='send'
-                ).classes(theme_manager.get_button_classes('primary', 'lg') + ' w-full')
+                ).classes(_BUTTON_PRIMARY_LG + ' w-full')
         
         # Note de confidentialité avec traduction
         self.render_privacy_note()
@@ -145,7 +150,7 @@ class ContactPage:
         ui.label(_('contact.info.title')).classes('text-3xl font-bold mb-6 text-main')
         
         # Informations principales
-        with ui.card().classes(theme_manager.get_card_classes(elevated=True) + ' p-6 mb-6'):
+        with ui.card().classes(_CARD_ELEVATED + ' p-6 mb-6'):
             with ui.column().classes('gap-4'):
                 # Email
                 with ui.row().classes('items-center gap-3'):
@@ -186,7 +191,7 @@ class ContactPage:
     
     def render_social_media(self):
         """Rendre la section réseaux sociaux"""
-        with ui.card().classes(theme_manager.get_card_classes(elevated=True) + ' p-6'):
+        with ui.card().classes(_CARD_ELEVATED + ' p-6'):
             ui.label(_('footer.follow_us')).classes('text-lg font-semibold mb-4 text-main')
             
             with ui.row().classes('gap-3 flex-wrap'):
@@ -195,7 +200,7 @@ class ContactPage:
                         social["name"],
                         icon=social.get("icon", "link"),
                         on_click=lambda url=social["url"], name=social["name"]: self.handle_social_click(url, name)
-                    ).classes(theme_manager.get_button_classes('outline', 'sm'))
+                    ).classes(_BUTTON_OUTLINE_SM)
     
     def handle_social_click(self, url: str, name: str):
         """Gérer le clic sur un réseau social"""
@@ -221,7 +226,7 @@ class ContactPage:
         """Rendre les contacts d'urgence"""
         with ui.element('div').classes('grid grid-cols-1 md:grid-cols-3 gap-6 max-w-4xl mx-auto'):
             for emergency in self.emergency_contacts:
-                with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' p-6 text-center bg-card'):
+                with ui.card().classes(_CARD_HOVER + ' p-6 text-center bg-card'):
                     # Icône selon le type
                     icon = 'local_hospital' if emergency["name"] == _('contact.emergency.emergency_title') else 'phone'
                     ui.icon(icon).classes('text-4xl text-error mb-4')
@@ -354,7 +359,7 @@ class ContactPage:
                 
                 with ui.column().classes('max-w-3xl mx-auto gap-4'):
                     for faq in faq_items:
-                        with ui.card().classes(theme_manager.get_card_classes() + ' p-6'):
+                        with ui.card().classes(_CARD_HOVER + ' p-6'):
                             ui.label(_(faq["question_key"])).classes('text-lg font-semibold mb-3 text-main')
                             ui.label(_(faq["answer_key"])).classes('text-muted leading-relaxed')
     
@@ -1,5 +1,10 @@
 from nicegui import ui
-from core.theme import theme_manager
+from core.theme import button_classes, card_classes
+
+_BUTTON_OUTLINE_LG = button_classes('outline', 'lg')
+_BUTTON_PRIMARY_LG = button_classes('primary', 'lg')
+_BUTTON_PRIMARY_MD = button_classes('primary', 'md')
+_CARD_HOVER = card_classes(hover=True)
 
 class HomePage:
     """Page d'accueil avec système de thème centralisé et traductions - CLÉS CORRIGÉES"""
@@ -70,7 +75,7 @@ class HomePage:
                         _('home.learn_more'),  # CORRIGÉ: était 'home.llearn_more'
                         on_click=lambda: ui.navigate.to('/about'),
                         icon='info'
-                    ).classes(theme_manager.get_button_classes('outline', 'lg') + ' border-2 border-white text-white hover:bg-white hover:text-primary')
+                    ).classes(_BUTTON_OUTLINE_LG + ' border-2 border-white text-white hover:bg-white hover:text-primary')
     
     def render_features_section(self):
         """Rendre la section des fonctionnalités avec classes de thème et traductions - CLÉS CORRIGÉES"""
@@ -96,7 +101,7 @@ class HomePage:
         except:
             def _(key): return key.split('.')[-1].replace('_', ' ').title()
         
-        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' p-6 text-center cursor-pointer'):
+        with ui.card().classes(_CARD_HOVER + ' p-6 text-center cursor-pointer'):
             # Icône avec couleur de thème
             ui.icon(feature['icon']).classes('text-6xl mb-4 text-primary')
             
@@ -111,7 +116,7 @@ class HomePage:
                 _('common.read_more'),
                 on_click=lambda url=feature['url']: ui.navigate.to(url),
                 icon='arrow_forward'
-            ).classes(theme_manager.get_button_classes('primary', 'md'))
+            ).classes(_BUTTON_PRIMARY_MD)
     
     def render_stats_section(self):
         """Rendre la section des statistiques avec gradient de thème et traductions - CLÉS CORRIGÉES"""
@@ -155,13 +160,13 @@ class HomePage:
                         _('home.cta.explore_articles'),  # CORRIGÉ: était 'home.ccta.explore_articles'
                         on_click=lambda: ui.navigate.to('/articles'),
                         icon='article'
-                    ).classes(theme_manager.get_button_classes('primary', 'lg'))
+                    ).classes(_BUTTON_PRIMARY_LG)
                     
                     ui.button(
                         _('home.cta.contact_us'),  # CORRIGÉ: était 'home.ccta.contact_us'
                         on_click=lambda: ui.navigate.to('/contact'),
                         icon='contact_mail'
-                    ).classes(theme_manager.get_button_classes('outline', 'lg'))
+                    ).classes(_BUTTON_OUTLINE_LG)
     
     def render_testimonials_section(self):
         """Section témoignages avec classes de thème (exemple avec texte statique pour simplicité)"""
@@ -189,7 +194,7 @@ class HomePage:
                 
                 with ui.element('div').classes('grid grid-cols-1 md:grid-cols-3 gap-8'):
                     for testimonial in testimonials:
-                        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' p-6 text-center'):
+                        with ui.card().classes(_CARD_HOVER + ' p-6 text-center'):
                             ui.icon('person').classes('text-4xl mb-4 text-primary')
                             ui.label(f'"{testimonial["text"]}"').classes('text-muted mb-4 italic')
                             ui.label(testimonial['name']).classes('font-semibold text-main')
@@ -226,7 +231,7 @@ class HomePage:
                 
                 with ui.element('div').classes('grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6'):
                     for feature in additional_features:
-                        with ui.card().classes(theme_manager.get_card_classes(hover=True) + ' text-center p-6'):
+                        with ui.card().classes(_CARD_HOVER + ' text-center p-6'):
                             ui.icon(feature["icon"]).classes('text-5xl mb-4 text-primary')
                             ui.label(feature["title"]).classes('text-lg font-bold mb-3 text-main')
                             ui.label(feature["description"]).classes('text-muted text-sm leading-relaxed')
@@ -1,9 +1,14 @@
 from nicegui import ui
 from core.i18n import i18n, _
-from core.theme import theme_manager
+from core.theme import button_classes, card_classes
 from config.database import SessionLocal, ReportService, Report
 from typing import List, Dict, Optional
 import json
+import orjson
+
+_BUTTON_OUTLINE_MD = button_classes('outline', 'md')
+_BUTTON_PRIMARY_MD = button_classes('primary', 'md')
+_CARD_HOVER = card_classes(hover=True)
 
 class ReportsPage:
     """Page des rapports utilisant la base de données"""
@@ -58,7 +63,7 @@ class ReportsPage:
                     "file_size": report.file_size or "0 MB",
                     "file_url": report.file_url or "",
                     "cover_image": report.cover_image,
-                    "tags": json.loads(report.tags) if report.tags else [],
+                    "tags": orjson.loads(report.tags) if report.tags else [],
                     "featured": report.featured or False,
                     "published": report.published or True
                 }
@@ -95,7 +100,7 @@ class ReportsPage:
                     "file_size": report.file_size or "0 MB",
                     "file_url": report.file_url or "",
                     "cover_image": report.cover_image,
-                    "tags": json.loads(report.tags) if report.tags else [],
+                    "tags": orjson.loads(report.tags) if report.tags else [],
                     "featured": report.featured or False,
                     "published": report.published or True
                 }
@@ -129,7 +134,7 @@ class ReportsPage:
                     "file_size": report.file_size or "0 MB",
                     "file_url": report.file_url or "",
                     "cover_image": report.cover_image,
-                    "tags": json.loads(report.tags) if report.tags else [],
+                    "tags": orjson.loads(report.tags) if report.tags else [],
                     "featured": report.featured or False,
                     "published": report.published or True
                 }
@@ -254,7 +259,7 @@ class ReportsPage:
     
     def render_sidebar(self):
         """Rendre la sidebar"""
-        with ui.card().classes(theme_manager.get_card_classes()):
+        with ui.card().classes(_CARD_HOVER):
             with ui.card_section().classes('p-6'):
                 ui.label("Statistiques").classes('text-lg font-semibold text-main mb-4')
                 
@@ -314,7 +319,7 @@ class ReportsPage:
     
     def render_report_card(self, report: Dict):
         """Rendre une carte de rapport"""
-        with ui.card().classes(theme_manager.get_card_classes(hover=True)):
+        with ui.card().classes(_CARD_HOVER):
             with ui.row().classes('p-6 gap-6'):
                 # Image de couverture ou placeholder
                 if report.get("cover_image"):
@@ -370,13 +375,13 @@ class ReportsPage:
                             "Télécharger",
                             on_click=lambda r=report: self.download_report(r),
                             icon='download'
-                        ).classes(theme_manager.get_button_classes('primary', 'md'))
+                        ).classes(_BUTTON_PRIMARY_MD)
                         
                         ui.button(
                             "Aperçu",
                             on_click=lambda r=report: self.view_report(r),
                             icon='visibility'
-                        ).classes(theme_manager.get_button_classes('outline', 'md'))
+                        ).classes(_BUTTON_OUTLINE_MD)
     
     def render_empty_state(self):
         """Rendre l'état vide"""
@@ -386,7 +391,7 @@ class ReportsPage:
             ui.button(
                 "Voir tous les rapports",
                 on_click=self.reset_filters
-            ).classes(theme_manager.get_button_classes('primary', 'md'))
+            ).classes(_BUTTON_PRIMARY_MD)
     
     def render_pagination(self):
         """Rendre la pagination simple"""
@@ -406,7 +411,7 @@ class ReportsPage:
                     ui.button(
                         str(page),
                         on_click=lambda p=page: self.change_page(p)
-                    ).classes(theme_manager.get_button_classes('primary', 'md'))
+                    ).classes(_BUTTON_PRIMARY_MD)
                 else:
                     ui.button(
                         str(page),
@@ -474,8 +479,8 @@ class ReportsPage:
         if report.get('file_url'):
             ui.run_javascript(f"""
                 const link = document.createElement('a');
-                link.href = '{report['file_url']}';
-                link.download = '{report['title']}.pdf';
+                link.href = {json.dumps(report['file_url'])};
+                link.download = {json.dumps(report['title'] + '.pdf')};
                 link.click();
             """)
     
@@ -0,0 +1,106 @@
+import asyncio
+from types import SimpleNamespace
+
+from core.theme import ThemeManager, Theme, ThemePreference
+
+
+def test_set_system_theme_outside_page_context():
+    """Le debounce fonctionne depuis une route API, sans client NiceGUI"""
+    manager = ThemeManager()
+    manager.theme_preference = ThemePreference.AUTO
+
+    async def notify_burst():
+        # Rafale de notifications: seule la dernière doit être appliquée
+        manager.set_system_theme(Theme.DARK)
+        manager.set_system_theme(Theme.LIGHT)
+        manager.set_system_theme(Theme.DARK)
+        assert manager.system_theme == Theme.LIGHT
+        await asyncio.sleep(0.35)
+
+    asyncio.run(notify_burst())
+
+    assert manager.system_theme == Theme.DARK
+    assert manager.current_theme == Theme.DARK
+
+
+def test_set_system_theme_keeps_forced_preference():
+    """Une préférence forcée n'est pas remplacée par le thème système"""
+    manager = ThemeManager()
+    manager.theme_preference = ThemePreference.LIGHT
+    manager.current_theme = Theme.LIGHT
+
+    async def notify():
+        manager.set_system_theme(Theme.DARK)
+        await asyncio.sleep(0.35)
+
+    asyncio.run(notify())
+
+    assert manager.system_theme == Theme.DARK
+    assert manager.current_theme == Theme.LIGHT
+
+
+def test_set_system_theme_ignores_repeated_notification():
+    """Une notification sans changement ne programme aucune écriture"""
+    manager = ThemeManager()
+    manager.system_theme = Theme.LIGHT
+
+    async def notify():
+        manager.set_system_theme(Theme.LIGHT)
+        assert manager._system_debounce is None
+        # Retour à la valeur courante pendant l'attente: le changement en attente est remplacé
+        manager.set_system_theme(Theme.DARK)
+        manager.set_system_theme(Theme.LIGHT)
+        assert manager._system_debounce is not None
+        await asyncio.sleep(0.35)
+
+    asyncio.run(notify())
+
+    assert manager.system_theme == Theme.LIGHT
+
+
+def test_page_head_html_follows_user_preference():
+    """Le script d'amorçage d'une page reprend la préférence courante (un script par état)"""
+    manager = ThemeManager()
+    manager.theme_preference = ThemePreference.DARK
+    manager.current_theme = Theme.DARK
+
+    dark_head = manager._build_page_head_html()
+    assert "preference = 'dark'" in dark_head
+    assert manager._build_page_head_html() is dark_head
+
+    manager.theme_preference = ThemePreference.AUTO
+    manager.current_theme = Theme.LIGHT
+    assert "preference = 'auto'" in manager._build_page_head_html()
+    assert "'$server" not in manager._build_head_html()
+
+
+def test_theme_apply_is_coalesced_per_client(monkeypatch):
+    """Deux clients qui changent de thème dans la même fenêtre sont appliqués tous les deux"""
+    import core.theme as theme_module
+
+    timers = []
+    fake_ui = SimpleNamespace(
+        timer=lambda delay, callback, once=False: timers.append(callback),
+        run_javascript=lambda code: None,
+        notify=lambda message, type=None: None,
+    )
+    fake_context = SimpleNamespace(client=SimpleNamespace(id='a'))
+    monkeypatch.setattr(theme_module, 'ui', fake_ui)
+    monkeypatch.setattr(theme_module, 'context', fake_context)
+
+    monkeypatch.setattr(ThemeManager, 'save_theme_preferences', lambda self, user_storage=None: None)
+
+    manager = ThemeManager()
+    manager._head_html = ''
+
+    manager._schedule_theme_apply('A1')
+    manager._schedule_theme_apply('A2')
+    fake_context.client = SimpleNamespace(id='b')
+    manager._schedule_theme_apply('B')
+
+    # Un timer par client, le dernier message de chaque client conservé
+    assert len(timers) == 2
+    assert manager._pending_applies == {'a': 'A2', 'b': 'B'}
+    for flush in timers:
+        flush()
+    assert manager._pending_applies == {}